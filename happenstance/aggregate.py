@@ -3,20 +3,26 @@ from __future__ import annotations
 import math
 import os
 import re
+import threading
 import time
 import urllib.parse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import load_config
 from .hash import compute_meta
-from .io import append_meta, docs_path, read_json, write_json
+from .io import append_meta, cache_path, docs_path, read_json, write_json
 from .prompting import build_gap_bullets, month_spread_guidance
 from .search import build_live_search_params
 from .sources import (
-    _make_request,
     _restaurant_from_google_place,
     fetch_ai_events,
     fetch_ai_restaurants,
@@ -32,10 +38,74 @@ from .validate import filter_events_by_window
 NEARBY_RESTAURANT_RADIUS_METERS = 800.0  # ~0.5 miles
 MAX_NEARBY_RESTAURANTS_PER_EVENT = 3
 KM_PER_MILE = 1.609344
+EARTH_RADIUS_MILES = 3959.0
+# Below this separation (in degrees, ~35 miles) the equirectangular projection,
+# scaled by the cosine of each pair's mean latitude, is within 0.001% of Haversine
+# (measured up to 60° latitude), far finer than the scoring distance buckets
+EQUIRECTANGULAR_MAX_DEGREES = 0.5
+# Coordinates are rounded to 4 decimal places (~11 m), far below any scoring distance
+# bucket, so nearby duplicates share geocode and distance cache entries
+COORD_DECIMALS = 4
+NEARBY_FETCH_WORKERS = 10  # Concurrent Places API requests; Nominatim stays sequential
 
 # Pairing algorithm constants
 EVENING_HOUR_THRESHOLD = 19  # 7 PM in 24-hour format
 VARIETY_PENALTY_MULTIPLIER = 3  # Penalty per previous use of a restaurant
+WALKING_DISTANCE_BONUS = 8  # Largest distance bonus; bounds what an ungeocoded candidate can gain
+
+# Cuisine keywords that pair well with each kind of event
+MUSIC_CUISINES = frozenset({"american", "italian", "mediterranean", "sushi"})
+ART_CUISINES = frozenset({"italian", "french", "contemporary", "american"})
+SPORTS_CUISINES = frozenset({"american", "bbq", "pizza", "mexican"})
+FAMILY_CUISINES = frozenset({"pizza", "american", "italian", "mexican"})
+EVENING_CUISINES = frozenset({"sushi", "asian"})
+_CUISINE_WORD_RE = re.compile(r"[a-z]+")
+
+# Shared HTTP session so geocoding and Places calls reuse pooled keep-alive connections
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.5, status_forcelist=_RETRY_STATUSES),
+    ),
+)
+# Nominatim gets no transport-level retries: `_nominatim_get` retries through the
+# rate limiter instead, so a retried request never skips the one-per-second spacing
+_SESSION.mount("https://nominatim.openstreetmap.org/", HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0))
+# Custom User-Agent is required by Nominatim policy; requests already negotiates compression
+_SESSION.headers["User-Agent"] = "Happenstance/1.0 (github.com/evcatalyst/happenstance)"
+
+# Persistent geocode cache in the user cache directory so warm runs skip Nominatim
+GEOCODE_CACHE_FILE = "geocode_cache.json"
+GEOCODE_CACHE_TTL_SECONDS = 30 * 24 * 3600  # Venues rarely move; refresh monthly to pick up OSM fixes
+_geocode_cache: Dict[str, Dict[str, float]] | None = None
+_geocode_cache_dirty = False
+# Lookups that failed during this run; not persisted, so they are retried next run
+_geocode_misses: set[str] = set()
+NOMINATIM_SEARCH_URL = "https://nominatim.openstreetmap.org/search"
+# Only the first hit's lat/lon is read, so the address breakdown is not requested
+_NOMINATIM_PARAMS = MappingProxyType({"format": "json", "limit": 1})
+# Nominatim allows one request per second from a single thread. Each request
+# reserves the next free start slot, so a lookup only waits out whatever part of
+# the interval the previous round trip didn't already use.
+NOMINATIM_MIN_INTERVAL_SECONDS = 1.0
+NOMINATIM_RETRIES = 2
+_last_nominatim_call = 0.0
+_nominatim_lock = threading.Lock()
+
+# Raw Places Nearby Search results keyed by ~110 m grid cell, so co-located events share one request
+NEARBY_CACHE_FILE = "nearby_cache.json"
+NEARBY_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_nearby_cache: Dict[str, Dict[str, Any]] | None = None
+_nearby_cache_dirty = False
+
+# Places API key, read once at import and refreshed by `aggregate` after the
+# project .env is loaded; nearby lookups are a no-op without it
+_GOOGLE_PLACES_API_KEY: str | None = os.getenv("GOOGLE_PLACES_API_KEY")
+
 
 def _stable_id(kind: str, *parts: object) -> str:
     raw = "-".join(str(part) for part in parts if part)
@@ -100,6 +170,15 @@ def _item_coords(item: Mapping) -> Dict[str, float] | None:
     )
 
 
+def _round_coords(lat: float, lon: float) -> tuple[float, float]:
+    return round(lat, COORD_DECIMALS), round(lon, COORD_DECIMALS)
+
+
+def _item_latlng(item: Mapping) -> tuple[float, float] | None:
+    coords = _item_coords(item)
+    return _round_coords(coords["lat"], coords["lng"]) if coords else None
+
+
 def _item_area_coords(item: Mapping, cfg: Mapping) -> Dict[str, float] | None:
     text = str(item.get("address") or item.get("venue") or item.get("location") or "")
     return _known_coords_for_text(text, cfg)
@@ -189,6 +268,98 @@ def _build_google_maps_url(place_id: str | None, name: str, location: str) -> st
     return f"https://www.google.com/search?q={urllib.parse.quote(name)}+{urllib.parse.quote(location)}"
 
 
+def _geocode_cache_key(address: str, region: str) -> str:
+    return f"{address.strip()}|{region.strip()}".lower()
+
+
+def _read_cache_file(filename: str) -> Dict[str, Any]:
+    stored = read_json(cache_path(filename))
+    return stored if isinstance(stored, dict) else {}
+
+
+def _unexpired(cache: Mapping[str, Mapping[str, Any]], ttl_seconds: float, keep: set[str]) -> Dict[str, Any]:
+    """Entries younger than ``ttl_seconds``, plus any whose key is in ``keep``."""
+    cutoff = time.time() - ttl_seconds
+    return {key: entry for key, entry in cache.items() if entry.get("ts", 0) > cutoff or key in keep}
+
+
+def _geocode_cache_load() -> Dict[str, Dict[str, Any]]:
+    """Return the in-memory geocode cache, loading it from the cache directory on first use."""
+    global _geocode_cache
+    if _geocode_cache is None:
+        _geocode_cache = _read_cache_file(GEOCODE_CACHE_FILE)
+    return _geocode_cache
+
+
+def _geocode_cache_save() -> None:
+    """Write the geocode cache back if any entries changed, dropping expired ones."""
+    global _geocode_cache_dirty
+    if _geocode_cache is None or not _geocode_cache_dirty:
+        return
+    # Stale entries whose refresh failed this run are kept; they are still the best coordinates we have
+    write_json(
+        cache_path(GEOCODE_CACHE_FILE), _unexpired(_geocode_cache, GEOCODE_CACHE_TTL_SECONDS, _geocode_misses)
+    )
+    _geocode_cache_dirty = False
+
+
+def _nearby_cache_load() -> Dict[str, Dict[str, Any]]:
+    """Return the in-memory nearby search cache, loading it from the cache directory on first use."""
+    global _nearby_cache
+    if _nearby_cache is None:
+        _nearby_cache = _read_cache_file(NEARBY_CACHE_FILE)
+    return _nearby_cache
+
+
+def _nearby_cache_save() -> None:
+    """Write the nearby search cache back if any new searches were stored, dropping expired ones."""
+    global _nearby_cache_dirty
+    if _nearby_cache is None or not _nearby_cache_dirty:
+        return
+    write_json(cache_path(NEARBY_CACHE_FILE), _unexpired(_nearby_cache, NEARBY_CACHE_TTL_SECONDS, set()))
+    _nearby_cache_dirty = False
+
+
+def _nearby_cell_key(lat: float, lng: float, max_results: int) -> str:
+    # Three decimal places is a ~110 m grid, well inside the search radius
+    return f"{lat:.3f},{lng:.3f},{int(NEARBY_RESTAURANT_RADIUS_METERS)},{max_results}"
+
+
+def _wait_for_nominatim_slot() -> None:
+    """Sleep until this thread's Nominatim request may start, reserving that start time."""
+    global _last_nominatim_call
+    with _nominatim_lock:
+        now = time.monotonic()
+        start = max(now, _last_nominatim_call + NOMINATIM_MIN_INTERVAL_SECONDS)
+        _last_nominatim_call = start
+    if start > now:
+        time.sleep(start - now)
+
+
+def _nominatim_get(params: Mapping[str, Any], headers: Mapping[str, str]) -> requests.Response:
+    """
+    Send a Nominatim search, retrying busy/server-error replies and connection errors.
+    
+    Every attempt, retries included, waits for its own rate-limit slot.
+    
+    Returns:
+        The last response, which may still carry a retryable status
+    """
+    attempt = 0
+    while True:
+        _wait_for_nominatim_slot()
+        try:
+            # The session supplies the User-Agent that Nominatim requires
+            response = _SESSION.get(NOMINATIM_SEARCH_URL, params=params, headers=headers, timeout=10)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= NOMINATIM_RETRIES:
+                raise
+        else:
+            if response.status_code not in _RETRY_STATUSES or attempt >= NOMINATIM_RETRIES:
+                return response
+        attempt += 1
+
+
 def _geocode_address(address: str, region: str = "San Francisco") -> tuple[float, float] | None:
     """
     Geocode an address using OpenStreetMap Nominatim (free, no API key needed).
@@ -198,42 +369,80 @@ def _geocode_address(address: str, region: str = "San Francisco") -> tuple[float
         region: Fallback city/region from config
         
     Returns:
-        Tuple of (latitude, longitude) or None if fails
+        Tuple of (latitude, longitude), the expired cached coordinates if a
+        refresh fails, or None if the lookup fails with nothing cached
     """
+    global _geocode_cache_dirty
     if not address:
         return None
     
+    cache = _geocode_cache_load()
+    cache_key = _geocode_cache_key(address, region)
+    cached = cache.get(cache_key)
+    if cached and time.time() - cached.get("ts", 0) < GEOCODE_CACHE_TTL_SECONDS:
+        return _round_coords(cached["lat"], cached["lon"])
+    if cache_key in _geocode_misses:
+        return _round_coords(cached["lat"], cached["lon"]) if cached else None
+    
     # Ensure city is included for better accuracy
     full_query = f"{address}, {region}"
+    params = {**_NOMINATIM_PARAMS, "q": full_query}
     
-    url = "https://nominatim.openstreetmap.org/search"
-    params = {
-        "q": full_query,
-        "format": "json",
-        "limit": 1,
-        "addressdetails": 1,
-    }
-    headers = {
-        # Custom User-Agent is required by Nominatim policy
-        "User-Agent": "Happenstance/1.0 (github.com/evcatalyst/happenstance)"
-    }
+    # A stale entry is revalidated with the validators Nominatim sent last time, so an
+    # unchanged result comes back as a bodyless 304 instead of a fresh JSON payload
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
     
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=10)
+        response = _nominatim_get(params, headers)
+        if response.status_code == 304 and headers:
+            cached["ts"] = int(time.time())
+            _geocode_cache_dirty = True
+            return _round_coords(cached["lat"], cached["lon"])
         response.raise_for_status()
         data = response.json()
         if data:
-            lat = float(data[0]["lat"])
-            lon = float(data[0]["lon"])
-            # Be polite to the free service
-            time.sleep(1)
+            lat, lon = _round_coords(float(data[0]["lat"]), float(data[0]["lon"]))
+            entry = {"lat": lat, "lon": lon, "ts": int(time.time())}
+            if response.headers.get("ETag"):
+                entry["etag"] = response.headers["ETag"]
+            if response.headers.get("Last-Modified"):
+                entry["last_modified"] = response.headers["Last-Modified"]
+            cache[cache_key] = entry
+            _geocode_cache_dirty = True
             return lat, lon
     except Exception as e:
         print(f"Geocoding failed for '{full_query}': {e}")
     
+    _geocode_misses.add(cache_key)
+    if cached:
+        # A failed refresh keeps serving the expired coordinates rather than dropping
+        # the venue; its timestamp is left alone so the next run tries again
+        return _round_coords(cached["lat"], cached["lon"])
     return None
 
 
+def _geocode_batch(addresses: List[str], region: str = "San Francisco") -> Dict[str, tuple[float, float] | None]:
+    """
+    Geocode many addresses, looking up each unique address only once.
+    
+    Lookups run one at a time, as Nominatim's usage policy asks of bulk clients;
+    the rate limit already paces them at one request per second.
+    
+    Args:
+        addresses: Address or venue strings (duplicates and blanks are ignored)
+        region: Fallback city/region from config
+        
+    Returns:
+        Mapping of address to (latitude, longitude), or None where geocoding failed
+    """
+    unique = [address for address in dict.fromkeys(addresses) if address]
+    return {address: _geocode_address(address, region=region) for address in unique}
+
+
 def _calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate distance between two coordinates using Haversine formula.
@@ -245,25 +454,77 @@ def _calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> f
     Returns:
         Distance in miles
     """
-    # Radius of Earth in miles
-    R = 3959.0
+    # Per-point radians and cosine come from the shared cache, so one-off calls on
+    # venues seen before only pay for the pairwise sin/asin terms
+    return _haversine_prepped(_prep_point(lat1, lon1), _prep_point(lat2, lon2))
+
+
+@lru_cache(maxsize=4096)
+def _prep_point(lat: float, lon: float) -> tuple[float, float, float]:
+    """
+    Precompute the per-point Haversine terms for a coordinate.
+    
+    Venues recur across many pairs, so caching these terms avoids recomputing
+    the radians conversion and cosine for every event/restaurant combination.
+    
+    Returns:
+        Tuple of (latitude in radians, longitude in radians, cosine of latitude)
+    """
+    lat_rad = math.radians(lat)
+    return lat_rad, math.radians(lon), math.cos(lat_rad)
+
+
+def _haversine_prepped(p1: tuple[float, float, float], p2: tuple[float, float, float]) -> float:
+    """Haversine distance in miles between two points prepared by `_prep_point`."""
+    dlat = p2[0] - p1[0]
+    dlon = p2[1] - p1[1]
+    a = math.sin(dlat / 2)**2 + p1[2] * p2[2] * math.sin(dlon / 2)**2
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+
+def _equirectangular_prepped(p1: tuple[float, float, float], p2: tuple[float, float, float]) -> float:
+    """Equirectangular approximation in miles; one cosine and no asin per pair."""
+    dx = (p2[1] - p1[1]) * math.cos((p1[0] + p2[0]) / 2)
+    dy = p2[0] - p1[0]
+    return EARTH_RADIUS_MILES * math.hypot(dx, dy)
+
+
+@lru_cache(maxsize=100_000)
+def _pair_distance(origin: tuple[float, float], point: tuple[float, float]) -> float:
+    """
+    Distance in miles between two coordinates, memoized per pair.
     
-    # Convert to radians
-    lat1_rad = math.radians(lat1)
-    lon1_rad = math.radians(lon1)
-    lat2_rad = math.radians(lat2)
-    lon2_rad = math.radians(lon2)
+    Points within EQUIRECTANGULAR_MAX_DEGREES use the cheaper equirectangular
+    approximation; farther points use full Haversine.
+    """
+    lat0, lon0 = origin
+    lat, lon = point
+    if abs(lat - lat0) <= EQUIRECTANGULAR_MAX_DEGREES and abs(lon - lon0) <= EQUIRECTANGULAR_MAX_DEGREES:
+        return _equirectangular_prepped(_prep_point(lat0, lon0), _prep_point(lat, lon))
+    return _haversine_prepped(_prep_point(lat0, lon0), _prep_point(lat, lon))
+
+
+def _distance_from(origin: tuple[float, float]) -> Callable[[tuple[float, float] | None], float | None]:
+    """
+    Build a distance function for one origin.
     
-    # Haversine formula
-    dlat = lat2_rad - lat1_rad
-    dlon = lon2_rad - lon1_rad
-    a = math.sin(dlat / 2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2)**2
-    c = 2 * math.asin(math.sqrt(a))
+    The function returns the distance in miles to a point, or None when the point
+    has no coordinates. Every pair goes through `_pair_distance`, so it is computed
+    once however many events share the origin, and a pair's distance doesn't depend
+    on whether the point's coordinates came from the data or a geocode.
+    """
+    def distance(point: tuple[float, float] | None) -> float | None:
+        return None if point is None else _pair_distance(origin, point)
     
-    return R * c
+    return distance
 
 
-def _fetch_nearby_restaurants(event_location: str, region: str = "San Francisco", count: int = 5) -> List[Dict]:
+def _fetch_nearby_restaurants(
+    event_location: str,
+    region: str = "San Francisco",
+    count: int = 5,
+    coords: tuple[float, float] | None = None,
+) -> List[Dict]:
     """
     Fetch restaurants near a specific event location.
     
@@ -271,21 +532,52 @@ def _fetch_nearby_restaurants(event_location: str, region: str = "San Francisco"
         event_location: Event location string
         region: City/region for geocoding context
         count: Number of nearby restaurants to fetch
+        coords: Pre-geocoded (latitude, longitude) of the event location, if known
         
     Returns:
         List of restaurant dictionaries
     """
-    api_key = os.getenv("GOOGLE_PLACES_API_KEY")
+    api_key = _GOOGLE_PLACES_API_KEY
     if not api_key:
         return []
     
     # First geocode the event location
-    coords = _geocode_address(event_location, region=region)
+    if coords is None:
+        coords = _geocode_address(event_location, region=region)
     if not coords:
         return []
     
     lat, lng = coords
     
+    restaurants = []
+    for place in _search_nearby_places(lat, lng, count, api_key)[:count]:
+        restaurant = _restaurant_from_google_place(place, event_location)
+        restaurant["match_reason"] = restaurant.get("match_reason") or "Near event location"
+        restaurants.append(restaurant)
+    
+    return restaurants
+
+
+def _search_nearby_places(lat: float, lng: float, count: int, api_key: str) -> List[Dict]:
+    """
+    Run a Places API Nearby Search, reusing cached results for the same grid cell.
+    
+    Args:
+        lat, lng: Search center
+        count: Number of places wanted
+        api_key: Google Places API key
+        
+    Returns:
+        Raw place dictionaries from the API (empty if the request fails)
+    """
+    global _nearby_cache_dirty
+    max_results = min(count, 20)
+    cache = _nearby_cache_load()
+    cell = _nearby_cell_key(lat, lng, max_results)
+    cached = cache.get(cell)
+    if cached and time.time() - cached.get("ts", 0) < NEARBY_CACHE_TTL_SECONDS:
+        return cached["places"]
+    
     # Use Places API Nearby Search
     url = "https://places.googleapis.com/v1/places:searchNearby"
     
@@ -312,23 +604,55 @@ def _fetch_nearby_restaurants(event_location: str, region: str = "San Francisco"
             }
         },
         "includedTypes": ["restaurant"],
-        "maxResultCount": min(count, 20),
+        "maxResultCount": max_results,
     }
     
     try:
-        data = _make_request(url, headers=headers, method="POST", data=body)
+        response = _SESSION.post(url, headers=headers, json=body, timeout=10)
+        response.raise_for_status()
+        data = response.json()
     except Exception:
         return []
     
-    restaurants = []
     places = data.get("places", [])
+    cache[cell] = {"places": places, "ts": int(time.time())}
+    _nearby_cache_dirty = True
+    return places
+
+
+def _fetch_nearby_many(locations: List[str], region: str = "San Francisco", count: int = 5) -> Dict[str, List[Dict]]:
+    """
+    Fetch nearby restaurants for many event locations at once.
     
-    for place in places[:count]:
-        restaurant = _restaurant_from_google_place(place, event_location)
-        restaurant["match_reason"] = restaurant.get("match_reason") or "Near event location"
-        restaurants.append(restaurant)
+    Each unique location is geocoded once through `_geocode_batch`, then the
+    Places API searches run concurrently.
     
-    return restaurants
+    Args:
+        locations: Event location strings (duplicates and blanks are ignored)
+        region: City/region for geocoding context
+        count: Number of nearby restaurants to fetch per location
+        
+    Returns:
+        Mapping of location string to its list of nearby restaurants
+    """
+    if not _GOOGLE_PLACES_API_KEY:
+        return {}
+    
+    coords_by_location = _geocode_batch(locations, region=region)
+    located = [location for location, coords in coords_by_location.items() if coords]
+    if not located:
+        return {}
+    
+    # Load the shared cache here so worker threads never race to initialize it
+    _nearby_cache_load()
+    with ThreadPoolExecutor(max_workers=min(NEARBY_FETCH_WORKERS, len(located))) as executor:
+        results = executor.map(
+            lambda location: _fetch_nearby_restaurants(
+                location, region=region, count=count, coords=coords_by_location[location]
+            ),
+            located,
+        )
+        return dict(zip(located, results, strict=True))
 
 
 def _fixture_restaurants(region: str) -> List[Dict]:
@@ -398,36 +722,43 @@ def _fixture_events(region: str) -> List[Dict]:
     ]
 
 
+_US_COUNTRY_NAMES = {"us", "usa", "united states"}
+_STATE_ZIP_RE = re.compile(r"[A-Z]{2}(?:\s+\d{5}(?:-\d{4})?)?")
+# US-specific; could be made configurable for other regions
+_STATE_SUFFIX_RE = re.compile(r" (?:NY|CA|TX|State)")
+
+
+@lru_cache(maxsize=4096)
 def _extract_city(location_str: str) -> str:
     """
     Extract city name from a location string.
     
     Handles common patterns like "venue, City, STATE" or "address, City, STATE".
     Note: Currently optimized for US addresses with state abbreviations.
+    
+    State words are stripped from the city in one regex pass. On real addresses
+    this matches stripping " NY", " CA", " TX" and " State" in turn, but a word
+    that only forms once another is removed is kept ("Troy  CATX" -> "troy tx").
     """
     if not location_str:
         return ""
     
-    # Common city patterns: "venue, City, STATE" or "address, City, STATE"
-    parts = [p.strip() for p in location_str.split(",")]
-
-    if len(parts) >= 3 and parts[-1].strip().lower() in {"us", "usa", "united states"}:
-        state_zip = parts[-2].strip().upper()
-        if re.fullmatch(r"[A-Z]{2}(?:\s+\d{5}(?:-\d{4})?)?", state_zip):
-            return parts[-3].strip().lower()
+    head, sep, last = location_str.rpartition(",")
+    if not sep:
+        return location_str.lower()
+
+    # Google formatted addresses: "street, City, ST 12345, USA"
+    if last.strip().lower() in _US_COUNTRY_NAMES:
+        rest, sep, state_zip = head.rpartition(",")
+        if sep and _STATE_ZIP_RE.fullmatch(state_zip.strip().upper()):
+            return rest.rpartition(",")[2].strip().lower()
     
-    # If we have at least 2 parts, the second-to-last is usually the city
-    if len(parts) >= 2:
-        city = parts[-2].strip()
-        # Remove common state abbreviations and words that aren't part of city names
-        # This is US-specific; could be made configurable for other regions
-        for pattern in [" NY", " CA", " TX", " State"]:
-            city = city.replace(pattern, "")
-        return city.strip().lower()
-    
-    return location_str.lower()
+    # Otherwise the second-to-last part is usually the city; drop trailing state words
+    city = head.rpartition(",")[2].strip()
+    return _STATE_SUFFIX_RE.sub("", city).strip().lower()
 
 
+@lru_cache(maxsize=4096)
 def _cities_match_at_word_boundary(city1: str, city2: str) -> bool:
     """
     Check if one city name is a substring of another at word boundaries.
@@ -457,53 +788,113 @@ def _cities_match_at_word_boundary(city1: str, city2: str) -> bool:
     if city1 == city2:
         return True
     
-    # Check if city1 is in city2 at word boundaries
-    if city1 in city2:
-        idx = city2.find(city1)
-        before_ok = (idx == 0 or city2[idx-1] == ' ')
-        after_ok = (idx + len(city1) == len(city2) or city2[idx + len(city1)] == ' ')
-        if before_ok and after_ok:
-            return True
-    
-    # Check if city2 is in city1 at word boundaries
-    if city2 in city1:
-        idx = city1.find(city2)
-        before_ok = (idx == 0 or city1[idx-1] == ' ')
-        after_ok = (idx + len(city2) == len(city1) or city1[idx + len(city2)] == ' ')
-        if before_ok and after_ok:
-            return True
+    # Only the shorter name can appear inside the longer one, so one search covers both directions
+    shorter, longer = (city1, city2) if len(city1) <= len(city2) else (city2, city1)
+    return _city_boundary_pattern(shorter).search(longer) is not None
+
+
+@lru_cache(maxsize=1024)
+def _city_boundary_pattern(city: str) -> re.Pattern[str]:
+    # Boundaries are the string edges or a space, matching how city names are split into words
+    return re.compile(rf"(?:^| ){re.escape(city)}(?: |$)")
+
+
+@lru_cache(maxsize=1024)
+def _city_line_pattern(city: str) -> re.Pattern[str]:
+    # Same boundaries as _city_boundary_pattern, applied to each line of a newline-joined list
+    return re.compile(rf"(?:^| ){re.escape(city)}(?: |$)", re.MULTILINE)
+
+
+def _restaurant_features(restaurant: Mapping) -> tuple[str, str, Any]:
+    """
+    Derive the restaurant-side scoring inputs, which are the same for every event.
     
-    return False
+    Returns:
+        Tuple of (lowercased cuisine, city extracted from the lowercased address, rating)
+    """
+    cuisine = restaurant.get("cuisine", "").lower()
+    city = _extract_city(restaurant.get("address", "").lower())
+    return cuisine, city, restaurant.get("rating", 0)
 
 
-def _compute_match_score(
-    event: Dict, 
-    restaurant: Dict, 
-    distance_miles: float | None = None,
-    restaurant_use_count: int = 0
-) -> tuple[int, str]:
+def _is_evening(event_date: Any) -> bool:
+    if not event_date:
+        return False
+    try:
+        dt = datetime.fromisoformat(event_date.replace('Z', '+00:00'))
+    except Exception:
+        return False
+    return dt.hour >= EVENING_HOUR_THRESHOLD
+
+
+def _event_features(event: Mapping) -> tuple:
     """
-    Compute a match score between an event and restaurant.
+    Derive the event-side scoring inputs: city, music, art, sports, family and evening flags.
     
-    Scoring priorities:
-    1. Same city/location (10 points)
-    2. Close distance if available (2-8 points)
-    3. Cuisine-category match (2 points)
-    4. High rating (1 point)
-    5. Variety penalty (-3 per previous use)
+    These depend only on the event, so `_build_pairings` computes them once per
+    event rather than re-parsing the date and location for every restaurant.
     """
-    score = 0
-    reasons: List[str] = []
     category = event.get("category", "").lower()
-    cuisine = restaurant.get("cuisine", "").lower()
     title = event.get("title", "").lower()
-    match_reason = restaurant.get("match_reason", "")
-    location = event.get("location", "").lower()
-    address = restaurant.get("address", "").lower()
+    return (
+        _extract_city(event.get("location", "").lower()),
+        bool(category) and ("music" in category or "concert" in title or "orchestra" in title),
+        bool(category) and ("art" in category or "gallery" in title or "museum" in title),
+        "sports" in category,
+        "family" in title or "kids" in title or "family" in category,
+        _is_evening(event.get("date", "")),
+    )
+
 
-    # Extract cities for matching
-    event_city = _extract_city(location)
-    restaurant_city = _extract_city(address)
+def _score_key(event_features: tuple, restaurant_features: tuple[str, str, Any], distance_miles: float | None) -> tuple:
+    """
+    Combine `_event_features`, `_restaurant_features` and distance into the inputs the score depends on.
+    
+    Many events share a category, city and time of day, so keying on these
+    features lets `_score_features` reuse results across events.
+    """
+    return (*event_features, *restaurant_features, distance_miles)
+
+
+# Reason text per distance bucket, keyed by the bucket's points; penalties read "away"
+_DISTANCE_REASON_SUFFIXES = {WALKING_DISTANCE_BONUS: " - walking distance", 5: " - very close", 2: " away", 1: " drive"}
+
+
+def _distance_points(distance_miles: float | None) -> int:
+    """Score contribution of a distance in miles: a bonus when close, a penalty beyond 20 miles."""
+    if distance_miles is None:
+        return 0
+    if distance_miles < 0.5:
+        return WALKING_DISTANCE_BONUS
+    if distance_miles < 1.5:
+        return 5
+    if distance_miles < 3.0:
+        return 2
+    if distance_miles < 10.0:
+        return 1
+    if distance_miles > 20.0:
+        return -min(10, max(2, round((distance_miles - 20.0) / 5.0) + 2))
+    return 0
+
+
+@lru_cache(maxsize=8192)
+def _base_score(features_key: tuple) -> int:
+    """
+    Score of a `_score_key` tuple without its distance.
+    
+    Distance only adds `_distance_points`, so candidate search combines this
+    cached part with the points for each distance instead of keying the score
+    cache on every distinct distance.
+    """
+    return _score_features((*features_key, None))[0]
+
+
+@lru_cache(maxsize=8192)
+def _score_features(key: tuple) -> tuple[int, tuple[str, ...]]:
+    """Score a `_score_key` tuple, excluding the variety penalty which varies per call."""
+    event_city, music, art, sports, family, evening, cuisine, restaurant_city, rating, distance_miles = key
+    score = 0
+    reasons: List[str] = []
 
     # City/location matching (highest priority when distance unavailable)
     if event_city and restaurant_city:
@@ -515,77 +906,180 @@ def _compute_match_score(
             reasons.append(f"Nearby in {event_city.title()} area")
 
     # Distance-based scoring (if available)
-    if distance_miles is not None:
-        if distance_miles < 0.5:
-            score += 8
-            reasons.append(f"{distance_miles:.1f} mi - walking distance")
-        elif distance_miles < 1.5:
-            score += 5
-            reasons.append(f"{distance_miles:.1f} mi - very close")
-        elif distance_miles < 3.0:
-            score += 2
-            reasons.append(f"{distance_miles:.1f} mi away")
-        elif distance_miles < 10.0:
-            score += 1
-            reasons.append(f"{distance_miles:.1f} mi drive")
-        elif distance_miles > 20.0:
-            penalty = min(10, max(2, round((distance_miles - 20.0) / 5.0) + 2))
-            score -= penalty
-            reasons.append(f"{distance_miles:.1f} mi away")
-
-    # Penalize restaurants that have been used multiple times (encourage variety)
-    if restaurant_use_count > 0:
-        score -= restaurant_use_count * VARIETY_PENALTY_MULTIPLIER
-        
-    # Match category with cuisine
-    if category and cuisine:
+    distance_points = _distance_points(distance_miles)
+    if distance_points:
+        score += distance_points
+        reasons.append(f"{distance_miles:.1f} mi{_DISTANCE_REASON_SUFFIXES.get(distance_points, ' away')}")
+
+    # Match category with cuisine by whole words, e.g. "new american" or "pan-asian"
+    cuisine_words = frozenset(_CUISINE_WORD_RE.findall(cuisine))
+    if cuisine:
         # Special category matches
-        if "music" in category or "concert" in title or "orchestra" in title:
-            if any(k in cuisine for k in ["american", "italian", "mediterranean", "sushi"]):
+        if music:
+            if cuisine_words & MUSIC_CUISINES:
                 score += 2
                 reasons.append(f"{cuisine.title()} pairs well with live music")
-        if "art" in category or "gallery" in title or "museum" in title:
-            if any(k in cuisine for k in ["italian", "french", "contemporary", "american"]):
+        if art:
+            if cuisine_words & ART_CUISINES:
                 score += 2
                 reasons.append(f"Upscale {cuisine} for art events")
-        if "sports" in category:
-            if any(k in cuisine for k in ["american", "bbq", "pizza", "mexican"]):
+        if sports:
+            if cuisine_words & SPORTS_CUISINES:
                 score += 2
                 reasons.append(f"{cuisine.title()} is great sports event food")
 
     # Family-friendly matching
-    if "family" in title or "kids" in title or "family" in category:
-        if any(k in cuisine for k in ["pizza", "american", "italian", "mexican"]):
+    if family:
+        if cuisine_words & FAMILY_CUISINES:
             score += 2
             reasons.append(f"Family-friendly {cuisine}")
 
     # Late night events
-    event_date = event.get("date", "")
-    if event_date:
-        try:
-            from datetime import datetime
-            dt = datetime.fromisoformat(event_date.replace('Z', '+00:00'))
-            if dt.hour >= EVENING_HOUR_THRESHOLD:
-                if "sushi" in cuisine or "asian" in cuisine:
-                    score += 1
-                    reasons.append(f"{cuisine.title()} open for evening dining")
-        except Exception:
-            pass
+    if evening:
+        if cuisine_words & EVENING_CUISINES:
+            score += 1
+            reasons.append(f"{cuisine.title()} open for evening dining")
 
     # High-quality restaurants get a bonus (keep as integers)
-    rating = restaurant.get("rating", 0)
     if rating >= 4.7:
         score += 1
         reasons.append(f"⭐ {rating} rating")
     elif rating >= 4.5:
         score += 1  # Changed from 0.5 to 1 to keep score as integer
 
+    return score, tuple(reasons)
+
+
+def _compute_match_score(
+    event: Dict, 
+    restaurant: Dict, 
+    distance_miles: float | None = None,
+    restaurant_use_count: int = 0,
+    restaurant_features: tuple[str, str, Any] | None = None,
+    event_features: tuple | None = None,
+) -> tuple[int, str]:
+    """
+    Compute a match score between an event and restaurant.
+    
+    Scoring priorities:
+    1. Same city/location (10 points)
+    2. Close distance if available (2-8 points)
+    3. Cuisine-category match (2 points)
+    4. High rating (1 point)
+    5. Variety penalty (-3 per previous use)
+    
+    ``restaurant_features`` and ``event_features`` may be passed from
+    `_restaurant_features` and `_event_features` to avoid re-deriving them when
+    one restaurant or event is scored many times.
+    """
+    features = restaurant_features or _restaurant_features(restaurant)
+    score, reasons = _score_features(_score_key(event_features or _event_features(event), features, distance_miles))
+
+    # Penalize restaurants that have been used multiple times (encourage variety)
+    if restaurant_use_count > 0:
+        score -= restaurant_use_count * VARIETY_PENALTY_MULTIPLIER
+
     if not reasons:
-        reasons.append(match_reason or "Quality dining option")
+        return score, restaurant.get("match_reason", "") or "Quality dining option"
 
     return score, "; ".join(reasons)
 
 
+def _rows_by_city(restaurants: List[Dict]) -> Dict[str, List[int]]:
+    """
+    Group restaurant positions by the city in their address.
+    
+    Restaurants without a recognizable city are left out. Each group keeps the
+    original list order, so it can be used directly as a candidate ordering.
+    """
+    rows: Dict[str, List[int]] = defaultdict(list)
+    for row, restaurant in enumerate(restaurants):
+        city = _extract_city(restaurant.get("address", ""))
+        if city:
+            rows[city].append(row)
+    return dict(rows)
+
+
+def _word_boundary_city_rows(city: str, rows_by_city: Mapping[str, List[int]]) -> List[int]:
+    """
+    Rows from `_rows_by_city` whose city matches ``city`` at a word boundary, in row order.
+    
+    Cities containing ``city`` are found by one multiline regex scan over all city
+    names joined by newlines, and cities contained in ``city`` are looked up as its
+    runs of whole words. Together this is `_cities_match_at_word_boundary` applied
+    to every city, without a regex search per pair.
+    """
+    words = city.split(" ")
+    matched = {" ".join(words[start:end]) for start in range(len(words)) for end in range(start + 1, len(words) + 1)}
+    matched.intersection_update(rows_by_city)
+    vocabulary = "\n".join(rows_by_city)
+    for match in _city_line_pattern(city).finditer(vocabulary):
+        line_start = vocabulary.rfind("\n", 0, match.start()) + 1
+        line_end = vocabulary.find("\n", match.end())
+        matched.add(vocabulary[line_start:] if line_end == -1 else vocabulary[line_start:line_end])
+    return sorted(row for matched_city in matched for row in rows_by_city[matched_city])
+
+
+def _best_candidate(
+    event_features: tuple,
+    candidates: List[tuple[str, str, tuple[str, str, Any]]],
+    distances: List[float | None],
+    restaurant_use_count: Mapping[str, int],
+    event_coords: tuple[float, float] | None = None,
+    geocode: Callable[[str], tuple[float, float] | None] | None = None,
+) -> tuple[int, float]:
+    """
+    Find the highest-scoring candidate for an event without building reason text.
+    
+    Known-distance candidates are scored and the best kept in a single pass.
+    Candidates whose distance is still unknown are scored optimistically (as if
+    within walking distance) and only geocoded if that upper bound could still
+    beat the best score found so far, visiting those best-bound first so the
+    search stops as soon as none can win. Only these few are ever sorted.
+    
+    Args:
+        event_features: `_event_features` tuple of the event being paired
+        candidates: (name, address, `_restaurant_features` tuple) per restaurant
+        distances: Distance in miles to each candidate, or None when unknown;
+            filled in place for candidates geocoded during the search
+        restaurant_use_count: Times each restaurant name has already been paired
+        event_coords: Event (latitude, longitude), required to resolve distances
+        geocode: Address lookup used for candidates without known coordinates
+        
+    Returns:
+        Tuple of (index of the first best candidate, its score), or (-1, -inf) when empty
+    """
+    can_resolve = bool(event_coords) and geocode is not None
+    distance = _distance_from(event_coords) if can_resolve else None
+    best_index = -1
+    best_score = float("-inf")
+    unresolved: List[tuple[float, int]] = []
+    for index, ((name, address, features), distance_miles) in enumerate(zip(candidates, distances, strict=True)):
+        penalty = restaurant_use_count.get(name, 0) * VARIETY_PENALTY_MULTIPLIER
+        score = _base_score((*event_features, *features)) + _distance_points(distance_miles) - penalty
+        if distance_miles is None and can_resolve and address:
+            unresolved.append((score + WALKING_DISTANCE_BONUS, index))
+        elif score > best_score:
+            # Strictly greater, so ties keep the earliest candidate
+            best_index = index
+            best_score = score
+    
+    unresolved = [bound for bound in unresolved if bound[0] >= best_score]
+    unresolved.sort(key=lambda bound: (-bound[0], bound[1]))
+    for upper, index in unresolved:
+        if upper < best_score:
+            break
+        name, address, features = candidates[index]
+        distances[index] = distance(geocode(address))
+        penalty = restaurant_use_count.get(name, 0) * VARIETY_PENALTY_MULTIPLIER
+        score = _base_score((*event_features, *features)) + _distance_points(distances[index]) - penalty
+        # Ties go to the earliest candidate, matching a plain first-best scan
+        if score > best_score or (score == best_score and index < best_index):
+            best_index = index
+            best_score = score
+    return best_index, best_score
+
+
 def _build_pairings(events: List[Dict], restaurants: List[Dict], cfg: Mapping) -> List[Dict]:
     if not restaurants:
         return []
@@ -599,88 +1093,137 @@ def _build_pairings(events: List[Dict], restaurants: List[Dict], cfg: Mapping) -
     # Track restaurant usage to encourage variety
     restaurant_use_count: Dict[str, int] = {}
     
-    for event in events:
-        event_location = event.get("location", "")
-        
-        # Get event coordinates from normalized data first; geocode only as fallback.
-        event_coord_map = _item_coords(event)
-        event_coords = (event_coord_map["lat"], event_coord_map["lng"]) if event_coord_map else None
-        allow_event_geocode = event.get("source") != "BarPeople"
-        if event_coords is None and allow_event_geocode and event_location and event_location not in location_cache:
-            location_cache[event_location] = _geocode_address(event_location, region=region)
+    # Event fields used more than once are read into parallel columns up front
+    event_locations = [event.get("location", "") for event in events]
+    event_latlngs = [_item_latlng(event) for event in events]
+    
+    # Geocode event venues without coordinates up front, once per unique location
+    location_cache.update(
+        _geocode_batch(
+            [
+                location
+                for event, location, coords in zip(events, event_locations, event_latlngs, strict=True)
+                if coords is None and event.get("source") != "BarPeople"
+            ],
+            region=region,
+        )
+    )
+    
+    # Fetch nearby restaurants for every event location up front so the Places
+    # requests can run concurrently instead of one event at a time
+    nearby_lookup = bool(cfg.get("api_config", {}).get("google_places", {}).get("nearby_lookup", False))
+    nearby_by_location = (
+        _fetch_nearby_many(
+            event_locations,
+            region=region,
+            count=MAX_NEARBY_RESTAURANTS_PER_EVENT,
+        )
+        if nearby_lookup
+        else {}
+    )
+    
+    def geocode_restaurant(address: str) -> tuple[float, float] | None:
+        if address not in location_cache:
+            location_cache[address] = _geocode_address(address, region=region)
+        return location_cache[address]
+    
+    # Restaurant-side scoring inputs don't change between events, so each restaurant's
+    # (name, address, features) candidate is derived once into a column; the per-event
+    # search indexes these lists instead of looking up dict keys
+    restaurant_candidates = [
+        (restaurant.get("name", ""), restaurant.get("address", ""), _restaurant_features(restaurant))
+        for restaurant in restaurants
+    ]
+    nearby_candidates_by_location = {
+        location: [
+            (restaurant.get("name", ""), restaurant.get("address", ""), _restaurant_features(restaurant))
+            for restaurant in nearby
+        ]
+        for location, nearby in nearby_by_location.items()
+    }
+    # Same for known coordinates: resolve them once into lists indexed like the
+    # restaurant lists instead of re-parsing each restaurant per event
+    restaurant_latlng = [_item_latlng(restaurant) for restaurant in restaurants]
+    nearby_latlng_by_location = {
+        location: [_item_latlng(restaurant) for restaurant in nearby]
+        for location, nearby in nearby_by_location.items()
+    }
+    restaurant_rows_by_city = _rows_by_city(restaurants)
+    nearby_rows_by_location = {location: _rows_by_city(nearby) for location, nearby in nearby_by_location.items()}
+    # Main-list rows in cities matching each event city at a word boundary, worked
+    # out once per distinct event city instead of for every event
+    word_boundary_rows: Dict[str, List[int]] = {}
+    
+    for event, event_location, event_coords in zip(events, event_locations, event_latlngs, strict=True):
+        # Use event coordinates from normalized data first; geocode only as fallback.
         if event_coords is None:
             event_coords = location_cache.get(event_location)
         
-        nearby_lookup = bool(cfg.get("api_config", {}).get("google_places", {}).get("nearby_lookup", False))
-        nearby_restaurants = (
-            _fetch_nearby_restaurants(event_location, region=region, count=MAX_NEARBY_RESTAURANTS_PER_EVENT)
-            if nearby_lookup
-            else []
-        )
-        
-        # Combine nearby restaurants with the main restaurant list
+        # Nearby restaurants come first, then the main restaurant list. Rows below
+        # `offset` index the nearby columns and the rest the main columns at
+        # `row - offset`, so no combined per-event lists are built
         # Prefer nearby restaurants but allow fallback to main list
-        all_restaurants = nearby_restaurants + restaurants
+        nearby_restaurants = nearby_by_location.get(event_location, [])
+        nearby_candidates = nearby_candidates_by_location.get(event_location, [])
+        offset = len(nearby_restaurants)
         
         # Extract event city for geographic filtering
         event_city = _extract_city(event_location)
+        event_features = _event_features(event)
         
-        # Separate restaurants into same-city and other-city groups
+        # Prioritize: same city > nearby city > other, using rows grouped by city once
+        # Only consider lower priority groups if higher priority groups are empty,
+        # in which case "other" is every row
         # This ensures geographic proximity is prioritized over other factors
-        same_city_restaurants = []
-        nearby_city_restaurants = []
-        other_restaurants = []
-        
-        for restaurant in all_restaurants:
-            restaurant_address = restaurant.get("address", "")
-            restaurant_city = _extract_city(restaurant_address)
-            
-            if event_city and restaurant_city:
-                if event_city == restaurant_city:
-                    same_city_restaurants.append(restaurant)
-                elif _cities_match_at_word_boundary(event_city, restaurant_city):
-                    nearby_city_restaurants.append(restaurant)
-                else:
-                    other_restaurants.append(restaurant)
-            else:
-                other_restaurants.append(restaurant)
+        nearby_rows_by_city = nearby_rows_by_location.get(event_location, {})
+        rows: List[int] | range = []
+        if event_city:
+            rows = nearby_rows_by_city.get(event_city, []) + [
+                offset + row for row in restaurant_rows_by_city.get(event_city, [])
+            ]
+            if not rows:
+                if event_city not in word_boundary_rows:
+                    word_boundary_rows[event_city] = _word_boundary_city_rows(event_city, restaurant_rows_by_city)
+                rows = _word_boundary_city_rows(event_city, nearby_rows_by_city) + [
+                    offset + row for row in word_boundary_rows[event_city]
+                ]
+        if not rows:
+            rows = range(offset + len(restaurants))
+        candidates = [
+            nearby_candidates[row] if row < offset else restaurant_candidates[row - offset] for row in rows
+        ]
         
-        # Prioritize: same city > nearby city > other
-        # Only consider lower priority groups if higher priority groups are empty
-        candidate_restaurants = same_city_restaurants or nearby_city_restaurants or other_restaurants
+        # Use coordinates that are already known; the rest are geocoded by
+        # _best_candidate only if they could still win. Only candidate rows are
+        # measured, and each venue/restaurant pair is computed once by the memo
+        candidate_distances: List[float | None] = [None] * len(candidates)
+        if event_coords:
+            distance = _distance_from(event_coords)
+            nearby_latlng = nearby_latlng_by_location.get(event_location, [])
+            for idx, row in enumerate(rows):
+                coords = nearby_latlng[row] if row < offset else restaurant_latlng[row - offset]
+                if coords is None:
+                    coords = location_cache.get(candidates[idx][1])
+                candidate_distances[idx] = distance(coords)
         
         best_score = float("-inf")
         best_restaurant: Dict | None = None
         best_reason = ""
         best_distance: float | None = None
         
-        for restaurant in candidate_restaurants:
-            restaurant_name = restaurant.get("name", "")
-            restaurant_address = restaurant.get("address", "")
-            
-            # Calculate distance if both coordinates are available
-            distance_miles = None
-            restaurant_coord_map = _item_coords(restaurant)
-            restaurant_coords = (restaurant_coord_map["lat"], restaurant_coord_map["lng"]) if restaurant_coord_map else None
-            if event_coords and restaurant_coords is None and restaurant_address:
-                if restaurant_address not in location_cache:
-                    location_cache[restaurant_address] = _geocode_address(restaurant_address, region=region)
-                restaurant_coords = location_cache.get(restaurant_address)
-            if event_coords and restaurant_coords:
-                distance_miles = _calculate_distance(
-                    event_coords[0], event_coords[1],
-                    restaurant_coords[0], restaurant_coords[1]
-                )
-            
-            # Get current use count for this restaurant
-            use_count = restaurant_use_count.get(restaurant_name, 0)
-            
-            score, reason = _compute_match_score(event, restaurant, distance_miles, use_count)
-            if score > best_score:
-                best_score = score
-                best_restaurant = restaurant
-                best_reason = reason
-                best_distance = distance_miles
+        best_index, _ = _best_candidate(
+            event_features, candidates, candidate_distances, restaurant_use_count, event_coords, geocode_restaurant
+        )
+        if best_index >= 0:
+            row = rows[best_index]
+            best_restaurant = nearby_restaurants[row] if row < offset else restaurants[row - offset]
+            features = candidates[best_index][2]
+            best_distance = candidate_distances[best_index]
+            use_count = restaurant_use_count.get(candidates[best_index][0], 0)
+            # Only the winner's reason text is needed, so build it once here
+            best_score, best_reason = _compute_match_score(
+                event, best_restaurant, best_distance, use_count, features, event_features
+            )
         
         # Track that we've used this restaurant
         if best_restaurant:
@@ -752,7 +1295,8 @@ def _same_area(item: Mapping, area: str) -> bool:
 
 def _cluster_restaurants(area: str, event_items: List[Mapping], restaurants: List[Mapping], pairing_restaurant_ids: set[str], cfg: Mapping) -> List[Mapping]:
     event_coords = [_item_coords(event) for event in event_items]
-    event_coords = [coords for coords in event_coords if coords]
+    # Prepare each venue's Haversine terms once rather than per restaurant
+    event_points = [_prep_point(float(coords["lat"]), float(coords["lng"])) for coords in event_coords if coords]
 
     candidates: list[tuple[float, Mapping]] = []
     for restaurant in restaurants:
@@ -763,8 +1307,10 @@ def _cluster_restaurants(area: str, event_items: List[Mapping], restaurants: Lis
         if _same_area(restaurant, area):
             score += 10
         rcoords = _item_coords(restaurant)
-        distances = [_distance_km(rcoords, ecoords) for ecoords in event_coords]
-        distances = [km for km in distances if km is not None]
+        distances: list[float] = []
+        if rcoords:
+            rpoint = _prep_point(float(rcoords["lat"]), float(rcoords["lng"]))
+            distances = [_haversine_prepped(rpoint, point) * KM_PER_MILE for point in event_points]
         if distances:
             nearest = min(distances)
             if nearest <= 1.5:
@@ -1076,15 +1622,20 @@ def _fetch_events(cfg: Mapping) -> List[Dict]:
 
 
 def aggregate(profile: str | None = None) -> Dict[str, Mapping]:
+    global _GOOGLE_PLACES_API_KEY
     cfg = load_config(profile)
+    _GOOGLE_PLACES_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
+    _geocode_misses.clear()
     
     # Fetch data from configured sources
     restaurants = _normalize_restaurants(_fetch_restaurants(cfg), cfg)
     events = _normalize_events(filter_events_by_window(_fetch_events(cfg), cfg["event_window_days"]), cfg)
     events.sort(key=lambda event: _event_datetime(event) or datetime.max.replace(tzinfo=timezone.utc))
 
-    gap_cuisines = [c for c in cfg.get("target_cuisines", []) if c not in {r["cuisine"] for r in restaurants}]
-    gap_categories = [c for c in cfg.get("target_categories", []) if c not in {e["category"] for e in events}]
+    have_cuisines = {r["cuisine"].lower() for r in restaurants}
+    have_categories = {e["category"].lower() for e in events}
+    gap_cuisines = [c for c in cfg.get("target_cuisines", []) if c.lower() not in have_cuisines]
+    gap_categories = [c for c in cfg.get("target_categories", []) if c.lower() not in have_categories]
     gap_bullets = build_gap_bullets(gap_cuisines + gap_categories)
 
     previous_meta = read_json(docs_path("meta.json")) or {}
@@ -1111,6 +1662,8 @@ def aggregate(profile: str | None = None) -> Dict[str, Mapping]:
     }
 
     persist_outputs(restaurants, restaurants_meta, events, events_meta, cfg, meta_payload)
+    _geocode_cache_save()
+    _nearby_cache_save()
     return {"events": events, "restaurants": restaurants, "meta": meta_payload}
 
 
@@ -1,8 +1,11 @@
 import json
+import os
 from pathlib import Path
 from typing import Any, Mapping, Sequence
 
 DOCS_DIR = Path(__file__).resolve().parent.parent / "docs"
+# Lookup caches live outside docs/, which is published as the Pages site
+CACHE_DIR = Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "happenstance"
 
 
 def read_json(path: Path) -> Any:
@@ -22,6 +25,10 @@ def docs_path(filename: str) -> Path:
     return DOCS_DIR / filename
 
 
+def cache_path(filename: str) -> Path:
+    return CACHE_DIR / filename
+
+
 def append_meta(items: Sequence[Mapping], meta: Mapping) -> list:
     data = list(items)
     data.append({"_meta": meta})
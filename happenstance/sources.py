@@ -1450,11 +1450,11 @@ def _load_real_data_from_script(data_type: str) -> List[Dict]:
     module = importlib.util.module_from_spec(spec)
     spec.loader.exec_module(module)
     
-    # Get the data
+    # Get the data; the module exposes read-only records, so hand back copies
     if data_type == "restaurants":
-        return module.RESTAURANTS_DATA
+        return [dict(item) for item in module.RESTAURANTS_DATA]
     elif data_type == "events":
-        return module.EVENTS_DATA
+        return [dict(item) for item in module.EVENTS_DATA]
     else:
         raise ValueError(f"Unknown data type: {data_type}")
 
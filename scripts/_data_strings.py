@@ -0,0 +1,7 @@
+"""Generated by scripts/build_data.py from real_data.json; do not edit."""
+
+from typing import Final
+
+SOURCE_SHA256: Final[str] = "7176b9152a56f3c1a1768b99285823bf1f18afa495fbfb2d1a678ecfc62a088a"
+RESTAURANTS_JSON: Final[bytes] = b'[{"name":"Mario\'s Restaurant & Pizzeria","cuisine":"Italian","address":"2850 River Rd, Niskayuna, NY","location":{"lat":42.803226,"lng":-73.861929},"match_reason":"Classic Italian and pizza, neighborhood favorite","rating":4.5,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Mario\'s+Restaurant+Pizzeria+2850+River+Rd+Niskayuna+NY"},{"name":"Meat & Company","cuisine":"BBQ","address":"2321 Nott St E, Niskayuna, NY","location":{"lat":42.816615,"lng":-73.889916},"match_reason":"Excellent brisket, ribs, wings, and sides","rating":4.8,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Meat+Company+2321+Nott+St+E+Niskayuna+NY"},{"name":"Tequila\'s Mexican Bar & Grill","cuisine":"Mexican","address":"2305 Nott St, Niskayuna, NY","location":{"lat":42.815558,"lng":-73.892128},"match_reason":"Authentic flavors and friendly service","rating":4.1,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Tequila\'s+Mexican+Bar+Grill+2305+Nott+St+Niskayuna+NY"},{"name":"Maya Thai Bistro","cuisine":"Thai","address":"2015 Rosa Rd, Schenectady, NY","location":{"lat":42.82479,"lng":-73.911229},"match_reason":"Crafted Thai cuisine, crab rangoons recommended","rating":4.8,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Maya+Thai+Bistro+2015+Rosa+Rd+Schenectady+NY"},{"name":"VOLCANO Asian BBQ & Hot Pot","cuisine":"Asian","address":"2309 Nott St E, Niskayuna, NY","location":{"lat":42.816615,"lng":-73.889916},"match_reason":"Hot pot and Asian BBQ for group dining","rating":4.9,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=VOLCANO+Asian+BBQ+Hot+Pot+2309+Nott+St+E+Niskayuna+NY"},{"name":"New China Restaurant","cuisine":"Chinese","address":"1334 Gerling St, Schenectady, NY","location":{"lat":42.82338,"lng":-73.910228},"match_reason":"Consistent quality and friendly service","rating":4.3,"price_level":1,"url":"https://www.google.com/maps/search/?api=1&query=New+China+Restaurant+1334+Gerling+St+Schenectady+NY"},{"name":"Karma Bistro","cuisine":"Vegan","address":"2321 Nott St E, Niskayuna, NY","location":{"lat":42.816615,"lng":-73.889916},"match_reason":"Poke bowls and noodle dishes, vegan options available","rating":4.6,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Karma+Bistro+2321+Nott+St+E+Niskayuna+NY"},{"name":"Blue Ribbon Restaurant & Bakery","cuisine":"American","address":"1801 State St, Schenectady, NY","location":{"lat":42.78072,"lng":-73.903881},"match_reason":"Popular breakfast and American classics","rating":4.5,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Blue+Ribbon+Restaurant+Bakery+1801+State+St+Schenectady+NY"},{"name":"Innovo Kitchen","cuisine":"American","address":"28 Clifton Country Rd, Clifton Park, NY","location":{"lat":42.863593,"lng":-73.780744},"match_reason":"Modern American with creative local menu","rating":4.7,"price_level":3,"url":"https://www.google.com/maps/search/?api=1&query=Innovo+Kitchen+28+Clifton+Country+Rd+Clifton+Park+NY"},{"name":"Delmonico\'s Italian Steakhouse","cuisine":"Italian","address":"1553 Central Ave, Albany, NY","location":{"lat":42.714945,"lng":-73.829094},"match_reason":"Classic Italian-American fare and steaks","rating":4.5,"price_level":3,"url":"https://www.google.com/maps/search/?api=1&query=Delmonico\'s+Italian+Steakhouse+1553+Central+Ave+Albany+NY"},{"name":"Hiro\'s Japanese Restaurant","cuisine":"Sushi","address":"193 Lark St, Albany, NY","location":{"lat":42.656459,"lng":-73.763879},"match_reason":"Renowned for fresh sushi and rolls","rating":4.6,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Hiro\'s+Japanese+Restaurant+193+Lark+St+Albany+NY"},{"name":"Dinosaur Bar-B-Que","cuisine":"BBQ","address":"377 River St, Troy, NY","location":{"lat":42.734618,"lng":-73.689269},"match_reason":"Famous chain with Southern BBQ classics","rating":4.4,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Dinosaur+Bar-B-Que+377+River+St+Troy+NY"},{"name":"Toro Cantina","cuisine":"Mexican","address":"111 Washington Ave Ext, Albany, NY","location":{"lat":42.691575,"lng":-73.84463},"match_reason":"Modern, lively Mexican eatery with cocktails","rating":4.5,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Toro+Cantina+111+Washington+Ave+Ext+Albany+NY"},{"name":"Thai Thai Bistro","cuisine":"Thai","address":"254 Lark St, Albany, NY","location":{"lat":42.654092,"lng":-73.765805},"match_reason":"Authentic Thai menu items","rating":4.7,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Thai+Thai+Bistro+254+Lark+St+Albany+NY"},{"name":"Hong Kong Bakery & Bistro","cuisine":"Chinese","address":"8 Wolf Rd, Colonie, NY","location":{"lat":42.709509,"lng":-73.82181},"match_reason":"Handmade dim sum and bakery items","rating":4.5,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Hong+Kong+Bakery+Bistro+8+Wolf+Rd+Colonie+NY"},{"name":"LaZeez Restaurant","cuisine":"Indian","address":"212 Central Ave, Albany, NY","location":{"lat":42.662195,"lng":-73.770248},"match_reason":"Indian and Pakistani classics, vegan-friendly","rating":4.4,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=LaZeez+Restaurant+212+Central+Ave+Albany+NY"},{"name":"Lark Street Collective Kitchen","cuisine":"Vegan","address":"258 Lark St, Albany, NY","location":{"lat":42.65401,"lng":-73.76589},"match_reason":"Vegan and vegetarian options in a hip setting","rating":4.6,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Lark+Street+Collective+Kitchen+258+Lark+St+Albany+NY"},{"name":"Osteria Danny","cuisine":"Italian","address":"26 Henry St, Saratoga Springs, NY","location":{"lat":43.079748,"lng":-73.782922},"match_reason":"Intimate, rustic and inventive Italian fare","rating":4.8,"price_level":3,"url":"https://www.google.com/maps/search/?api=1&query=Osteria+Danny+26+Henry+St+Saratoga+Springs+NY"},{"name":"Sushi Thai Garden","cuisine":"Sushi","address":"1808 US-9, Saratoga Springs, NY","location":{"lat":43.074337,"lng":-73.787377},"match_reason":"Sushi and Thai combo, consistently popular","rating":4.5,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Sushi+Thai+Garden+1808+US-9+Saratoga+Springs+NY"},{"name":"PJ\'s BAR-B-QSA","cuisine":"BBQ","address":"1 Kaydeross Ave W, Saratoga Springs, NY","location":{"lat":43.042549,"lng":-73.790215},"match_reason":"Famous for regional BBQ styles","rating":4.6,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=PJ\'s+BAR-B-QSA+1+Kaydeross+Ave+W+Saratoga+Springs+NY"},{"name":"Cantina","cuisine":"Mexican","address":"408 Broadway, Saratoga Springs, NY","location":{"lat":43.081638,"lng":-73.785026},"match_reason":"Trendy spot, extensive margaritas and tacos","rating":4.4,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Cantina+408+Broadway+Saratoga+Springs+NY"},{"name":"Thai Basil","cuisine":"Thai","address":"368 Broadway, Saratoga Springs, NY","location":{"lat":43.080692,"lng":-73.785377},"match_reason":"Authentic Thai dishes, curries and noodles","rating":4.6,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Thai+Basil+368+Broadway+Saratoga+Springs+NY"},{"name":"Great Tang Chinese Restaurant","cuisine":"Chinese","address":"60 West Ave, Saratoga Springs, NY","location":{"lat":43.081138,"lng":-73.803571},"match_reason":"Fresh, flavorful Chinese cuisine","rating":4.5,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Great+Tang+Chinese+Restaurant+60+West+Ave+Saratoga+Springs+NY"},{"name":"Karavalli Regional Cuisine of India","cuisine":"Indian","address":"47 Caroline St, Saratoga Springs, NY","location":{"lat":43.08191,"lng":-73.782692},"match_reason":"Well-reviewed for its diverse Indian menu","rating":4.7,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Karavalli+Regional+Cuisine+of+India+47+Caroline+St+Saratoga+Springs+NY"},{"name":"Four Seasons Natural Foods","cuisine":"Vegan","address":"33 Phila St, Saratoga Springs, NY","location":{"lat":43.08064,"lng":-73.784336},"match_reason":"Vegan deli, casual eatery, and grocery","rating":4.5,"price_level":1,"url":"https://www.google.com/maps/search/?api=1&query=Four+Seasons+Natural+Foods+33+Phila+St+Saratoga+Springs+NY"},{"name":"The Copper Crow","cuisine":"American","address":"2 Division St, Saratoga Springs, NY","location":{"lat":43.082041,"lng":-73.788343},"match_reason":"Upscale American with craft cocktails","rating":4.6,"price_level":3,"url":"https://www.google.com/maps/search/?api=1&query=The+Copper+Crow+2+Division+St+Saratoga+Springs+NY"},{"name":"Max London\'s Restaurant + Bar","cuisine":"American","address":"466 Broadway, Saratoga Springs, NY","location":{"lat":43.082953,"lng":-73.784668},"match_reason":"Farm-to-table American cuisine","rating":4.5,"price_level":3,"url":"https://www.google.com/maps/search/?api=1&query=Max+London\'s+Restaurant+Bar+466+Broadway+Saratoga+Springs+NY"},{"name":"15 Church Restaurant","cuisine":"American","address":"15 Church St, Saratoga Springs, NY","location":{"lat":43.083601,"lng":-73.785622},"match_reason":"Fine dining with seasonal menu","rating":4.7,"price_level":4,"url":"https://www.google.com/maps/search/?api=1&query=15+Church+Restaurant+15+Church+St+Saratoga+Springs+NY"},{"name":"Sake Cafe","cuisine":"Sushi","address":"415 Broadway, Saratoga Springs, NY","location":{"lat":43.081956,"lng":-73.785438},"match_reason":"Popular sushi spot with creative rolls","rating":4.5,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Sake+Cafe+415+Broadway+Saratoga+Springs+NY"},{"name":"Villa Valenti","cuisine":"Italian","address":"153 S Broadway, Saratoga Springs, NY","location":{"lat":43.071384,"lng":-73.78873},"match_reason":"Family-style Italian in historic building","rating":4.4,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Villa+Valenti+153+S+Broadway+Saratoga+Springs+NY"},{"name":"The Wine Bar & Bistro","cuisine":"American","address":"417 Broadway, Saratoga Springs, NY","location":{"lat":43.081911,"lng":-73.785736},"match_reason":"Cozy bistro with extensive wine list","rating":4.6,"price_level":3,"url":"https://www.google.com/maps/search/?api=1&query=The+Wine+Bar+Bistro+417+Broadway+Saratoga+Springs+NY"},{"name":"Hattie\'s Chicken Shack","cuisine":"American","address":"45 Phila St, Saratoga Springs, NY","location":{"lat":43.080519,"lng":-73.783463},"match_reason":"Famous for fried chicken and Southern comfort food","rating":4.5,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Hattie\'s+Chicken+Shack+45+Phila+St+Saratoga+Springs+NY"},{"name":"Druthers Brewing Company","cuisine":"American","address":"381 Broadway, Saratoga Springs, NY","location":{"lat":43.080875,"lng":-73.786479},"match_reason":"Craft brewery with pub fare","rating":4.4,"price_level":2,"url":"https://www.google.com/maps/search/?api=1&query=Druthers+Brewing+Company+381+Broadway+Saratoga+Springs+NY"},{"name":"Mouzon House","cuisine":"American","address":"1 York St, Saratoga Springs, NY","location":{"lat":43.084807,"lng":-73.782069},"match_reason":"Creole and Southern-inspired fine dining","rating":4.7,"price_level":3,"url":"https://www.google.com/maps/search/?api=1&query=Mouzon+House+1+York+St+Saratoga+Springs+NY"},{"name":"Jacob & Anthony\'s American Grille","cuisine":"American","address":"38 High Rock Ave, Saratoga Springs, NY","location":{"lat":43.08417,"lng":-73.781812},"match_reason":"Upscale American steakhouse","rating":4.6,"price_level":3,"url":"https://www.google.com/maps/search/?api=1&query=Jacob+Anthony\'s+American+Grille+38+High+Rock+Ave+Saratoga+Springs+NY"}]'
+EVENTS_JSON: Final[bytes] = b'[{"id":"event-chicago-proctors-2026-06-24","name":"Chicago at Proctors","title":"Chicago at Proctors","category":"live music","date":"2026-06-24T19:30:00+00:00","time":"19:30","venue":"Proctors Theatre","location":"Proctors Theatre, Schenectady, NY","coordinates":{"lat":42.8142,"lng":-73.9396},"url":"https://www.timesunion.com/music/article/chicago-band-coming-upstate-new-york-tour-21858163.php","source_url":"https://www.timesunion.com/music/article/chicago-band-coming-upstate-new-york-tour-21858163.php","description":"Chicago performs at Proctors Theatre in Schenectady.","duration_minutes":150,"tags":["concert","classic rock","schenectady"]},{"id":"event-alive-at-five-afrobeats-2026-06-25","name":"Alive at Five: Afrobeats Night","title":"Alive at Five: Afrobeats Night","category":"live music","date":"2026-06-25T17:00:00+00:00","time":"17:00","venue":"Warehouse District","location":"Warehouse District, Albany, NY","coordinates":{"lat":42.6642,"lng":-73.7451},"url":"https://www.timesunion.com/music/article/b-o-b-alive-at-five-albany-22309982.php","source_url":"https://www.timesunion.com/music/article/b-o-b-alive-at-five-albany-22309982.php","description":"Free Alive at Five concert featuring DJ TGIF, Soular Sounds and Afrellie.","duration_minutes":180,"tags":["free","concert","albany","afrobeats"]},{"id":"event-fence-2026-reception-2026-06-26","name":"Fence 2026 Opening Reception","title":"Fence 2026 Opening Reception","category":"art","date":"2026-06-26T18:00:00+00:00","time":"18:00","venue":"The Arts Center of the Capital Region","location":"The Arts Center of the Capital Region, Troy, NY","coordinates":{"lat":42.7284,"lng":-73.6918},"url":"https://www.timesunion.com/preview/article/events-albany-area-les-claypool-capital-pride-22297802.php","source_url":"https://www.timesunion.com/preview/article/events-albany-area-les-claypool-capital-pride-22297802.php","description":"Opening reception for Fence 2026, a juried show at The Arts Center.","duration_minutes":120,"tags":["art","opening","troy"]},{"id":"event-job-adirondack-theatre-festival-2026-06-26","name":"Adirondack Theatre Festival: Job","title":"Adirondack Theatre Festival: Job","category":"art","date":"2026-06-26T19:30:00+00:00","time":"19:30","venue":"Charles R. Wood Theater","location":"Charles R. Wood Theater, Glens Falls, NY","coordinates":{"lat":43.3095,"lng":-73.644},"url":"https://www.timesunion.com/preview/article/events-albany-area-les-claypool-capital-pride-22297802.php","source_url":"https://www.timesunion.com/preview/article/events-albany-area-les-claypool-capital-pride-22297802.php","description":"Adirondack Theatre Festival production of Max Wolf Friedlich\'s psychological thriller Job.","duration_minutes":120,"tags":["theater","glens falls"]},{"id":"event-albany-institute-blanche-lazzell-2026-06-27","name":"Blanche Lazzell: Becoming an American Modernist","title":"Blanche Lazzell: Becoming an American Modernist","category":"art","date":"2026-06-27T10:00:00+00:00","time":"10:00","venue":"Albany Institute of History & Art","location":"Albany Institute of History & Art, Albany, NY","coordinates":{"lat":42.6526,"lng":-73.7562},"url":"https://www.timesunion.com/preview/article/events-albany-area-les-claypool-capital-pride-22297802.php","source_url":"https://www.timesunion.com/preview/article/events-albany-area-les-claypool-capital-pride-22297802.php","description":"Albany Institute exhibition surveying Blanche Lazzell\'s modernist work.","duration_minutes":120,"tags":["museum","exhibition","albany"]},{"id":"event-fence-2026-exhibition-2026-06-27","name":"Fence 2026 Exhibition","title":"Fence 2026 Exhibition","category":"art","date":"2026-06-27T12:00:00+00:00","time":"12:00","venue":"The Arts Center of the Capital Region","location":"The Arts Center of the Capital Region, Troy, NY","coordinates":{"lat":42.7284,"lng":-73.6918},"url":"https://www.timesunion.com/preview/article/events-albany-area-les-claypool-capital-pride-22297802.php","source_url":"https://www.timesunion.com/preview/article/events-albany-area-les-claypool-capital-pride-22297802.php","description":"Fence 2026 juried exhibition, on view through July 24.","duration_minutes":90,"tags":["art","gallery","troy"]},{"id":"event-nycb-innovators-icons-spac-2026-07-08","name":"New York City Ballet: Innovators & Icons","title":"New York City Ballet: Innovators & Icons","category":"art","date":"2026-07-08T19:30:00+00:00","time":"19:30","venue":"Saratoga Performing Arts Center","location":"Saratoga Performing Arts Center, Saratoga Springs, NY","coordinates":{"lat":43.0554,"lng":-73.8059},"url":"https://www.timesunion.com/theater/article/new-york-city-ballet-brings-new-tiler-peck-work-21349620.php","source_url":"https://www.timesunion.com/theater/article/new-york-city-ballet-brings-new-tiler-peck-work-21349620.php","description":"NYCB program with a Tiler Peck world premiere, Balanchine and Robbins.","duration_minutes":150,"tags":["ballet","spac","saratoga"]},{"id":"event-nycb-midsummer-spac-2026-07-09","name":"New York City Ballet: A Midsummer Night\'s Dream","title":"New York City Ballet: A Midsummer Night\'s Dream","category":"art","date":"2026-07-09T19:30:00+00:00","time":"19:30","venue":"Saratoga Performing Arts Center","location":"Saratoga Performing Arts Center, Saratoga Springs, NY","coordinates":{"lat":43.0554,"lng":-73.8059},"url":"https://www.timesunion.com/theater/article/new-york-city-ballet-brings-new-tiler-peck-work-21349620.php","source_url":"https://www.timesunion.com/theater/article/new-york-city-ballet-brings-new-tiler-peck-work-21349620.php","description":"NYCB revives Balanchine\'s full-length A Midsummer Night\'s Dream at SPAC.","duration_minutes":150,"tags":["ballet","spac","saratoga"]},{"id":"event-cms-dvorak-spac-2026-07-12","name":"Chamber Music Society: Dvorak Quintet","title":"Chamber Music Society: Dvorak Quintet","category":"live music","date":"2026-07-12T19:00:00+00:00","time":"19:00","venue":"Arthur Zankel Music Center","location":"Arthur Zankel Music Center, Saratoga Springs, NY","coordinates":{"lat":43.0963,"lng":-73.786},"url":"https://www.timesunion.com/music/article/spac-announces-lincoln-center-summer-season-21199168.php","source_url":"https://www.timesunion.com/music/article/spac-announces-lincoln-center-summer-season-21199168.php","description":"Opening program of the Chamber Music Society of Lincoln Center\'s SPAC summer residency.","duration_minutes":120,"tags":["classical","saratoga","skidmore"]},{"id":"event-train-barenaked-ladies-spac-2026-07-22","name":"Train and Barenaked Ladies","title":"Train and Barenaked Ladies","category":"live music","date":"2026-07-22T19:00:00+00:00","time":"19:00","venue":"Saratoga Performing Arts Center","location":"Saratoga Performing Arts Center, Saratoga Springs, NY","coordinates":{"lat":43.0554,"lng":-73.8059},"url":"https://www.timesunion.com/music/article/train-barenaked-ladies-tour-saratoga-2026-21152353.php","source_url":"https://www.timesunion.com/music/article/train-barenaked-ladies-tour-saratoga-2026-21152353.php","description":"Train and Barenaked Ladies co-headline the Drops of Jupiter anniversary tour at SPAC.","duration_minutes":180,"tags":["concert","spac","saratoga"]},{"id":"event-guns-n-roses-spac-2026-07-26","name":"Guns N\' Roses at SPAC","title":"Guns N\' Roses at SPAC","category":"live music","date":"2026-07-26T19:00:00+00:00","time":"19:00","venue":"Saratoga Performing Arts Center","location":"Saratoga Performing Arts Center, Saratoga Springs, NY","coordinates":{"lat":43.0554,"lng":-73.8059},"url":"https://www.timesunion.com/music/article/guns-n-roses-bring-world-tour-spac-2026-21204762.php","source_url":"https://www.timesunion.com/music/article/guns-n-roses-bring-world-tour-spac-2026-21204762.php","description":"Guns N\' Roses bring their world tour to Saratoga Performing Arts Center.","duration_minutes":180,"tags":["concert","rock","spac","saratoga"]}]'
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+"""
+Precompute the compact real-data JSON served by generate_real_data.py.
+
+Writes _data_strings.py next to this script, holding the exported JSON payloads
+as bytes constants plus a hash of real_data.json. Re-run after editing the data
+file; generate_real_data.py ignores the constants once the hash no longer matches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+# Run as a script, so this directory is already on sys.path
+import generate_real_data as real_data
+
+OUTPUT_FILE = Path(__file__).with_name("_data_strings.py")
+
+
+def main():
+    source_sha256 = hashlib.sha256(real_data._DATA_FILE.read_bytes()).hexdigest()
+    restaurants_json = real_data._encode([dict(restaurant) for restaurant in real_data.RESTAURANTS_DATA])
+    events_json = real_data._encode([dict(event) for event in real_data.EVENTS_DATA])
+    OUTPUT_FILE.write_text(
+        f'"""Generated by scripts/build_data.py from real_data.json; do not edit."""\n'
+        f"\n"
+        f"from typing import Final\n"
+        f"\n"
+        f'SOURCE_SHA256: Final[str] = "{source_sha256}"\n'
+        f"RESTAURANTS_JSON: Final[bytes] = {restaurants_json!r}\n"
+        f"EVENTS_JSON: Final[bytes] = {events_json!r}\n",
+        encoding="utf-8",
+    )
+    print(f"Wrote {OUTPUT_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,43 @@
 """Tests for aggregate module functions."""
-from unittest.mock import MagicMock, patch
+import json
+import threading
+import time
+from collections import OrderedDict
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
 
+import pytest
+import requests
+
+from happenstance import aggregate
 from happenstance.aggregate import (
     _build_pairings,
     _calculate_distance,
     _cities_match_at_word_boundary,
     _compute_match_score,
+    _distance_from,
     _extract_city,
+    _fetch_nearby_many,
+    _fetch_nearby_restaurants,
     _geocode_address,
+    _geocode_batch,
+    _geocode_cache_save,
     _normalize_restaurants,
+    _word_boundary_city_rows,
 )
 
 
+@pytest.fixture(autouse=True)
+def empty_geocode_cache(monkeypatch):
+    """Keep the persistent lookup caches out of the user cache directory and isolated per test."""
+    monkeypatch.setattr(aggregate, "_geocode_cache", {})
+    monkeypatch.setattr(aggregate, "_geocode_cache_dirty", False)
+    monkeypatch.setattr(aggregate, "_geocode_misses", set())
+    monkeypatch.setattr(aggregate, "_nearby_cache", {})
+    monkeypatch.setattr(aggregate, "_nearby_cache_dirty", False)
+    monkeypatch.setattr(aggregate, "_last_nominatim_call", 0.0)
+
+
 class TestCityMatching:
     """Tests for city matching with word boundaries."""
 
@@ -19,6 +45,20 @@ class TestCityMatching:
         """Test city parsing for Google addresses with state, ZIP, and country."""
         assert _extract_city("307 Broadway, Saratoga Springs, NY 12866, USA") == "saratoga springs"
         assert _extract_city("4 Kurosaka Ln, Lake George, NY 12845, USA") == "lake george"
+
+    def test_extract_city_from_venue_strings(self):
+        """Test city parsing for venue strings without a country suffix."""
+        assert _extract_city("The Egg, Albany, NY") == "albany"
+        assert _extract_city("Downtown Troy, NY") == "downtown troy"
+        assert _extract_city("Empire State Plaza, Albany NY, US") == "albany"
+        assert _extract_city("Troy") == "troy"
+        assert _extract_city("") == ""
+
+    def test_extract_city_strips_state_words_in_one_pass(self):
+        """Test that state words are removed once each, without rescanning what the removal leaves."""
+        assert _extract_city("Capitol, Albany NY State, US") == "albany"
+        assert _extract_city("Pier 39, San Francisco CA, USA") == "san francisco"
+        assert _extract_city("Arena, Troy  CATX, NY") == "troy tx"
     
     def test_exact_match(self):
         """Test exact city name match."""
@@ -61,71 +101,322 @@ class TestCityMatching:
         assert _cities_match_at_word_boundary("troy", "albany") is False
         assert _cities_match_at_word_boundary("schenectady", "niskayuna") is False
 
+    def test_word_boundary_city_rows_match_both_directions(self):
+        """Test that city rows are found whether the city contains or is contained in the other."""
+        rows_by_city = {"saratoga": [3], "saratoga springs": [0, 4], "springsfield": [1], "troy": [2]}
+
+        assert _word_boundary_city_rows("saratoga springs", rows_by_city) == [0, 3, 4]
+        assert _word_boundary_city_rows("springs", rows_by_city) == [0, 4]
+        assert _word_boundary_city_rows("albany", rows_by_city) == []
+
+
+class _FakeResponse:
+    """Minimal stand-in for a successful `requests.Response` carrying a JSON body."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+class _NominatimAdapter(requests.adapters.BaseAdapter):
+    """Transport adapter that answers Nominatim searches with canned JSON and records each request."""
+
+    def __init__(self):
+        super().__init__()
+        self.payload: object = []
+        self.status = 200
+        self.headers: dict[str, str] = {}
+        self.error: Exception | None = None
+        self.calls: list[requests.PreparedRequest] = []
+        self.on_send = None
+
+    def send(self, request, **kwargs):
+        self.calls.append(request)
+        if self.on_send:
+            self.on_send()
+        if self.error:
+            raise self.error
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers.update(self.headers)
+        response._content = b"" if self.status == 304 else json.dumps(self.payload).encode()
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def nominatim(monkeypatch):
+    """Route Nominatim requests through the real session to a canned-response adapter."""
+    adapter = _NominatimAdapter()
+    monkeypatch.setattr(aggregate._SESSION, "adapters", OrderedDict(aggregate._SESSION.adapters))
+    aggregate._SESSION.mount(aggregate.NOMINATIM_SEARCH_URL, adapter)
+    return adapter
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Record rate-limit waits instead of sleeping through them."""
+    sleeps: list[float] = []
+    monkeypatch.setattr(aggregate.time, "sleep", sleeps.append)
+    return sleeps
+
 
 class TestGeocodeAddress:
     """Tests for Nominatim-based geocoding."""
     
-    @patch('happenstance.aggregate.requests.get')
-    @patch('happenstance.aggregate.time.sleep')
-    def test_geocode_success(self, mock_sleep, mock_get):
+    def test_geocode_success(self, nominatim, no_sleep):
         """Test successful geocoding with Nominatim."""
-        # Mock response
-        mock_response = MagicMock()
-        mock_response.json.return_value = [
-            {
-                "lat": "37.7749",
-                "lon": "-122.4194"
-            }
-        ]
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        nominatim.payload = [{"lat": "37.7749", "lon": "-122.4194"}]
         
         result = _geocode_address("Market Street", region="San Francisco")
         
         assert result == (37.7749, -122.4194)
-        assert mock_get.call_count == 1
-        assert mock_sleep.call_count == 1
+        assert len(nominatim.calls) == 1
+        assert no_sleep == []
         
         # Verify the request was made correctly
-        call_args = mock_get.call_args
-        assert call_args[1]['params']['q'] == "Market Street, San Francisco"
-        assert call_args[1]['params']['format'] == "json"
-        assert 'User-Agent' in call_args[1]['headers']
+        request = nominatim.calls[0]
+        query = parse_qs(urlsplit(request.url).query)
+        assert query['q'] == ["Market Street, San Francisco"]
+        assert query['format'] == ["json"]
+        assert "addressdetails" not in query
+        assert request.headers['User-Agent'].startswith("Happenstance/")
     
-    @patch('happenstance.aggregate.requests.get')
-    @patch('happenstance.aggregate.time.sleep')
-    def test_geocode_empty_address(self, mock_sleep, mock_get):
+    def test_geocode_waits_only_remaining_interval(self, nominatim, no_sleep, monkeypatch):
+        """Test that back-to-back lookups wait out only the rest of the rate-limit second."""
+        nominatim.payload = [{"lat": "42.6526", "lon": "-73.7562"}]
+        monkeypatch.setattr(aggregate.time, "monotonic", iter([100.0, 100.25]).__next__)
+
+        _geocode_address("Albany", region="NY")
+        _geocode_address("Troy", region="NY")
+
+        assert no_sleep == [pytest.approx(0.75)]
+
+    def test_geocode_retries_through_rate_limiter(self, nominatim, no_sleep):
+        """Test that a 429 is retried only after waiting for the next rate-limit slot."""
+        nominatim.payload = [{"lat": "42.6526", "lon": "-73.7562"}]
+        statuses = iter([429, 200])
+        nominatim.on_send = lambda: setattr(nominatim, "status", next(statuses))
+
+        assert _geocode_address("Albany", region="NY") == (42.6526, -73.7562)
+        assert len(nominatim.calls) == 2
+        assert no_sleep == [pytest.approx(aggregate.NOMINATIM_MIN_INTERVAL_SECONDS, abs=0.1)]
+
+    def test_nominatim_has_no_transport_retries(self):
+        """Test that urllib3 never resends Nominatim requests behind the rate limiter's back."""
+        adapter = aggregate._SESSION.get_adapter(aggregate.NOMINATIM_SEARCH_URL)
+        assert adapter.max_retries.total == 0
+
+    def test_geocode_empty_address(self, nominatim, no_sleep):
         """Test geocoding with empty address."""
         result = _geocode_address("", region="San Francisco")
         
         assert result is None
-        assert mock_get.call_count == 0
-        assert mock_sleep.call_count == 0
+        assert nominatim.calls == []
+        assert no_sleep == []
     
-    @patch('happenstance.aggregate.requests.get')
-    @patch('happenstance.aggregate.time.sleep')
-    def test_geocode_no_results(self, mock_sleep, mock_get):
+    def test_geocode_no_results(self, nominatim):
         """Test geocoding when Nominatim returns no results."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
-        
         result = _geocode_address("Invalid Address", region="San Francisco")
         
         assert result is None
     
-    @patch('happenstance.aggregate.requests.get')
-    @patch('happenstance.aggregate.time.sleep')
-    def test_geocode_request_error(self, mock_sleep, mock_get):
+    def test_geocode_request_error(self, nominatim):
         """Test geocoding when request fails."""
-        mock_get.side_effect = Exception("Network error")
+        nominatim.error = requests.ConnectionError("Network error")
         
         result = _geocode_address("Market Street", region="San Francisco")
         
         assert result is None
 
 
+class TestGeocodeBatch:
+    """Tests for batched geocoding."""
+
+    @patch('happenstance.aggregate._geocode_address')
+    def test_batch_deduplicates_addresses(self, mock_geocode):
+        """Test that repeated and blank addresses are not geocoded twice."""
+        mock_geocode.side_effect = lambda address, region: (1.0, 2.0) if "Troy" in address else None
+
+        result = _geocode_batch(["Troy, NY", "", "Troy, NY", "Nowhere"], region="Capital Region, NY")
+
+        assert result == {"Troy, NY": (1.0, 2.0), "Nowhere": None}
+        assert mock_geocode.call_count == 2
+
+    def test_batch_looks_up_one_address_at_a_time(self, nominatim, no_sleep):
+        """Test that batched lookups run serially on the calling thread, spaced by the rate limit."""
+        nominatim.payload = [{"lat": "42.7284", "lon": "-73.6918"}]
+        threads: list[int] = []
+        nominatim.on_send = lambda: threads.append(threading.get_ident())
+
+        result = _geocode_batch(["Troy, NY", "Albany, NY"], region="Capital Region, NY")
+
+        assert result == {"Troy, NY": (42.7284, -73.6918), "Albany, NY": (42.7284, -73.6918)}
+        assert threads == [threading.get_ident()] * 2
+        assert len(no_sleep) == 1
+
+
+class TestGeocodeCache:
+    """Tests for the persistent geocode cache."""
+
+    def test_cache_hit_skips_network(self, nominatim, no_sleep):
+        """Test that a repeated lookup is served from the cache."""
+        nominatim.payload = [{"lat": "42.7284", "lon": "-73.6918"}]
+
+        first = _geocode_address("Downtown Troy", region="Capital Region, NY")
+        second = _geocode_address("downtown troy", region="capital region, ny")
+
+        assert first == second == (42.7284, -73.6918)
+        assert len(nominatim.calls) == 1
+        assert no_sleep == []
+
+    def test_expired_entry_is_refreshed(self, nominatim):
+        """Test that entries older than the TTL are looked up again and replaced."""
+        aggregate._geocode_cache["downtown troy|capital region, ny"] = {"lat": 1.0, "lon": 2.0, "ts": 0}
+        nominatim.payload = [{"lat": "42.7284", "lon": "-73.6918"}]
+
+        assert _geocode_address(" Downtown Troy ", region="Capital Region, NY") == (42.7284, -73.6918)
+        assert _geocode_address("Downtown Troy", region="Capital Region, NY") == (42.7284, -73.6918)
+        assert len(nominatim.calls) == 1
+
+    def test_expired_entry_is_served_when_refresh_fails(self, nominatim):
+        """Test that an outage keeps the expired coordinates instead of losing the venue."""
+        entry = {"lat": 42.7284, "lon": -73.6918, "ts": 0}
+        aggregate._geocode_cache["troy|ny"] = entry
+        nominatim.error = requests.ConnectionError("Network error")
+
+        assert _geocode_address("Troy", region="NY") == (42.7284, -73.6918)
+        assert _geocode_address("Troy", region="NY") == (42.7284, -73.6918)
+        assert len(nominatim.calls) == aggregate.NOMINATIM_RETRIES + 1
+        assert aggregate._geocode_cache["troy|ny"] == entry
+
+    def test_expired_entry_is_served_when_refresh_finds_nothing(self, nominatim):
+        """Test that an empty refresh result also falls back to the expired coordinates."""
+        aggregate._geocode_cache["troy|ny"] = {"lat": 42.7284, "lon": -73.6918, "ts": 0}
+
+        assert _geocode_address("Troy", region="NY") == (42.7284, -73.6918)
+
+    def test_stale_entry_is_revalidated_with_validators(self, nominatim, monkeypatch):
+        """Test that a stale entry sends its ETag/Last-Modified and keeps its coordinates on a 304."""
+        nominatim.payload = [{"lat": "42.7284", "lon": "-73.6918"}]
+        nominatim.headers = {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jul 2026 00:00:00 GMT"}
+        assert _geocode_address("Downtown Troy", region="Capital Region, NY") == (42.7284, -73.6918)
+
+        entry = aggregate._geocode_cache["downtown troy|capital region, ny"]
+        assert entry["etag"] == '"abc"'
+        entry["ts"] = 0
+        nominatim.status = 304
+        monkeypatch.setattr(aggregate, "_geocode_cache_dirty", False)
+
+        assert _geocode_address("Downtown Troy", region="Capital Region, NY") == (42.7284, -73.6918)
+        assert nominatim.calls[1].headers["If-None-Match"] == '"abc"'
+        assert nominatim.calls[1].headers["If-Modified-Since"] == "Wed, 01 Jul 2026 00:00:00 GMT"
+        assert entry["ts"] > 0
+        assert aggregate._geocode_cache_dirty is True
+
+    def test_failed_lookup_is_not_cached(self, nominatim):
+        """Test that misses are retried on the next run rather than persisted."""
+        assert _geocode_address("Nowhere", region="Capital Region, NY") is None
+        assert aggregate._geocode_cache == {}
+
+    def test_failed_lookup_not_retried_in_same_run(self, nominatim):
+        """Test that a miss is remembered for the rest of the run."""
+        nominatim.error = requests.ConnectionError("Network error")
+
+        assert _geocode_address("Nowhere", region="Capital Region, NY") is None
+        assert _geocode_address("Nowhere", region="Capital Region, NY") is None
+        assert len(nominatim.calls) == aggregate.NOMINATIM_RETRIES + 1
+
+    def test_save_round_trip(self, tmp_path, monkeypatch):
+        """Test that new entries are written to the cache directory and loaded back."""
+        monkeypatch.setattr(aggregate, "cache_path", lambda name: tmp_path / name)
+        entry = {"lat": 42.7, "lon": -73.6, "ts": int(time.time())}
+        aggregate._geocode_cache["troy|ny"] = entry
+        aggregate._geocode_cache_dirty = True
+
+        _geocode_cache_save()
+        monkeypatch.setattr(aggregate, "_geocode_cache", None)
+
+        assert aggregate._geocode_cache_load() == {"troy|ny": entry}
+
+    def test_save_drops_expired_entries(self, tmp_path, monkeypatch):
+        """Test that expired geocode and nearby entries are not written back."""
+        monkeypatch.setattr(aggregate, "cache_path", lambda name: tmp_path / name)
+        now = int(time.time())
+        aggregate._geocode_cache.update({"old|ny": {"lat": 1.0, "lon": 2.0, "ts": 0}, "new|ny": {"lat": 1.0, "lon": 2.0, "ts": now}})
+        aggregate._nearby_cache.update({"old": {"places": [], "ts": 0}, "new": {"places": [], "ts": now}})
+        monkeypatch.setattr(aggregate, "_geocode_cache_dirty", True)
+        monkeypatch.setattr(aggregate, "_nearby_cache_dirty", True)
+
+        _geocode_cache_save()
+        aggregate._nearby_cache_save()
+
+        assert list(json.loads((tmp_path / aggregate.GEOCODE_CACHE_FILE).read_text())) == ["new|ny"]
+        assert list(json.loads((tmp_path / aggregate.NEARBY_CACHE_FILE).read_text())) == ["new"]
+
+
+class TestFetchNearbyMany:
+    """Tests for batched nearby restaurant lookups."""
+
+    @patch('happenstance.aggregate._geocode_address')
+    @patch('happenstance.aggregate._fetch_nearby_restaurants')
+    def test_deduplicates_locations(self, mock_fetch_nearby, mock_geocode, monkeypatch):
+        """Test that each unique location is geocoded and searched once."""
+        monkeypatch.setattr(aggregate, "_GOOGLE_PLACES_API_KEY", "test-key")
+        mock_geocode.return_value = (42.7284, -73.6918)
+        mock_fetch_nearby.return_value = [{"name": "Dinosaur Bar-B-Que"}]
+
+        result = _fetch_nearby_many(["Downtown Troy, NY", "Downtown Troy, NY", ""], region="Capital Region, NY")
+
+        assert result == {"Downtown Troy, NY": [{"name": "Dinosaur Bar-B-Que"}]}
+        assert mock_geocode.call_count == 1
+        assert mock_fetch_nearby.call_count == 1
+        assert mock_fetch_nearby.call_args[1]["coords"] == (42.7284, -73.6918)
+
+    @patch('happenstance.aggregate._geocode_address')
+    def test_missing_api_key_skips_geocoding(self, mock_geocode, monkeypatch):
+        """Test that no geocoding happens when nearby search is unavailable."""
+        monkeypatch.setattr(aggregate, "_GOOGLE_PLACES_API_KEY", None)
+
+        assert _fetch_nearby_many(["Downtown Troy, NY"]) == {}
+        assert mock_geocode.call_count == 0
+
+    @patch('happenstance.aggregate._geocode_address')
+    def test_missing_api_key_skips_single_lookup(self, mock_geocode, monkeypatch):
+        """Test that a single nearby lookup returns immediately without a key."""
+        monkeypatch.setattr(aggregate, "_GOOGLE_PLACES_API_KEY", None)
+
+        assert _fetch_nearby_restaurants("Downtown Troy, NY") == []
+        assert mock_geocode.call_count == 0
+
+
+class TestNearbySearchCache:
+    """Tests for reuse of Places Nearby Search results."""
+
+    @patch('happenstance.aggregate._SESSION.post')
+    def test_colocated_events_share_one_search(self, mock_post, monkeypatch):
+        """Test that locations in the same grid cell reuse the cached places."""
+        monkeypatch.setattr(aggregate, "_GOOGLE_PLACES_API_KEY", "test-key")
+        mock_post.return_value = _FakeResponse({
+            "places": [{"id": "p1", "displayName": {"text": "Dinosaur Bar-B-Que"}, "formattedAddress": "377 River St, Troy, NY"}]
+        })
+
+        first = _fetch_nearby_restaurants("Troy Music Hall", count=3, coords=(42.73112, -73.69021))
+        second = _fetch_nearby_restaurants("Troy Music Hall Lobby", count=3, coords=(42.73101, -73.69034))
+
+        assert [r["name"] for r in first] == [r["name"] for r in second] == ["Dinosaur Bar-B-Que"]
+        assert mock_post.call_count == 1
+
+
 class TestCalculateDistance:
     """Tests for haversine distance calculation."""
     
@@ -157,6 +448,26 @@ class TestCalculateDistance:
         assert distance < 1.0
         assert distance > 0
 
+    def test_distance_from_matches_scalar(self):
+        """Test that origin-bound distances agree with the scalar Haversine."""
+        origin = (37.7749, -122.4194)
+        points = [(37.7820, -122.4194), (37.8044, -122.2712), (34.0522, -118.2437), (37.7749, -122.4194)]
+
+        distance = _distance_from(origin)
+
+        for lat, lon in points:
+            expected = _calculate_distance(origin[0], origin[1], lat, lon)
+            # Nearby points use the equirectangular approximation
+            assert abs(distance((lat, lon)) - expected) <= max(expected * 1e-5, 1e-9)
+
+    def test_distance_from_uses_pair_memo(self):
+        """Test that origin-bound distances are the memoized pair distances, and None without coordinates."""
+        origin = (37.7749, -122.4194)
+        distance = _distance_from(origin)
+
+        assert distance((34.0522, -118.2437)) == aggregate._pair_distance(origin, (34.0522, -118.2437))
+        assert distance(None) is None
+
 
 class TestBuildPairings:
     """Tests for building event-restaurant pairings with distance calculation."""
@@ -308,6 +619,24 @@ class TestBuildPairings:
             assert "Troy" in pairing["event"]
             assert pairing["restaurant"] in ["Dinosaur Bar-B-Que", "Plumb Oyster Bar"], \
                 f"Troy event '{pairing['event']}' should not be paired with '{pairing['restaurant']}' in Niskayuna"
+        
+    
+    @patch('happenstance.aggregate._geocode_address')
+    @patch('happenstance.aggregate._fetch_nearby_restaurants')
+    def test_pairings_never_geocode_restaurants_outside_event_city(self, mock_fetch_nearby, mock_geocode):
+        """Test that restaurants filtered out by city matching cost no geocoding calls."""
+        mock_geocode.side_effect = lambda address, region: (42.7317, -73.6925) if address == "Downtown Troy, NY" else None
+        mock_fetch_nearby.return_value = []
+        events = [{"title": "Troy Night Out", "category": "arts", "location": "Downtown Troy, NY"}]
+        restaurants = [
+            {"name": "Dinosaur Bar-B-Que", "cuisine": "BBQ", "address": "377 River St, Troy, NY"},
+            {"name": "Mario's Restaurant & Pizzeria", "cuisine": "Italian", "address": "2850 River Rd, Niskayuna, NY"},
+        ]
+        
+        _build_pairings(events, restaurants, {"region": "Capital Region, NY"})
+        
+        geocoded = {call.args[0] for call in mock_geocode.call_args_list}
+        assert geocoded == {"Downtown Troy, NY", "377 River St, Troy, NY"}
     
     @patch('happenstance.aggregate._geocode_address')
     @patch('happenstance.aggregate._fetch_nearby_restaurants')
@@ -343,6 +672,115 @@ class TestBuildPairings:
         assert pairings[0]["event"] == "Schenectady Art Walk"
         assert pairings[0]["restaurant"] == "Dinosaur Bar-B-Que"
 
+    @patch('happenstance.aggregate._geocode_address')
+    @patch('happenstance.aggregate._fetch_nearby_restaurants')
+    def test_pairings_skip_geocoding_candidates_that_cannot_win(self, mock_fetch_nearby, mock_geocode):
+        """Test that a candidate whose best possible score loses is never geocoded."""
+        mock_geocode.return_value = None
+        mock_fetch_nearby.return_value = []
+
+        events = [
+            {
+                "title": "Troy Night Out",
+                "category": "arts",
+                "location": "Downtown Troy, NY",
+                "coordinates": {"lat": 42.7317, "lng": -73.6925},
+            }
+        ]
+        restaurants = [
+            {
+                "name": "Close Cafe",
+                "cuisine": "Cafe",
+                "address": "1 River St, Troy, NY",
+                "location": {"lat": 42.7318, "lng": -73.6926},
+                "rating": 4.8,
+            },
+            {"name": "Unmapped Diner", "cuisine": "Diner", "address": "9 Far Rd, Troy, NY"},
+        ]
+
+        pairings = _build_pairings(events, restaurants, {"region": "Capital Region, NY"})
+
+        assert pairings[0]["restaurant"] == "Close Cafe"
+        assert mock_geocode.call_count == 0
+
+    @patch('happenstance.aggregate._fetch_nearby_restaurants')
+    def test_pairings_measure_only_candidate_restaurants(self, mock_fetch_nearby):
+        """Test that only same-city candidates are measured, once per rounded venue pair."""
+        mock_fetch_nearby.return_value = []
+        aggregate._pair_distance.cache_clear()
+        events = [
+            {"title": f"SPAC Show {n}", "category": "music", "location": "SPAC, Saratoga Springs, NY",
+             "coordinates": {"lat": 43.05541 + n * 1e-6, "lng": -73.8059}}
+            for n in range(3)
+        ]
+        restaurants = [
+            {"name": "Hattie's", "cuisine": "Southern", "address": "45 Phila St, Saratoga Springs, NY",
+             "location": {"lat": 43.0817, "lng": -73.7846}},
+            {"name": "Max London's", "cuisine": "American", "address": "466 Broadway, Saratoga Springs, NY",
+             "location": {"lat": 43.0829, "lng": -73.7848}},
+            {"name": "Dinosaur Bar-B-Que", "cuisine": "BBQ", "address": "377 River St, Troy, NY",
+             "location": {"lat": 42.7350, "lng": -73.6880}},
+        ]
+
+        pairings = _build_pairings(events, restaurants, {"region": "Capital Region, NY"})
+
+        assert len(pairings) == 3
+        # Two Saratoga candidates measured for the first event; the Troy restaurant never is
+        assert aggregate._pair_distance.cache_info().misses == 2
+        assert aggregate._pair_distance.cache_info().hits == 4
+        assert pairings[0]["distance_km"] == round(
+            _calculate_distance(43.0554, -73.8059, 43.0829, -73.7848) * aggregate.KM_PER_MILE, 2
+        )
+
+    @patch('happenstance.aggregate._geocode_address')
+    @patch('happenstance.aggregate._fetch_nearby_many')
+    def test_pairings_index_nearby_and_main_restaurants(self, mock_fetch_nearby_many, mock_geocode):
+        """Test that nearby rows come before the main list and each event sees only its own nearby places."""
+        mock_geocode.return_value = None
+        mock_fetch_nearby_many.return_value = {
+            "Music Haven, Schenectady, NY": [
+                {"name": "Nearby Pub", "cuisine": "American", "address": "1 State St, Schenectady, NY",
+                 "url": "https://example.com/pub"},
+            ],
+        }
+        events = [
+            {"title": "Park Concert", "category": "music", "location": "Music Haven, Schenectady, NY"},
+            {"title": "River Show", "category": "music", "location": "Riverfront, Troy, NY"},
+        ]
+        restaurants = [
+            {"name": "Dinosaur Bar-B-Que", "cuisine": "BBQ", "address": "377 River St, Troy, NY",
+             "url": "https://example.com/dino"},
+            {"name": "Albany Grill", "cuisine": "American", "address": "9 Pearl St, Albany, NY",
+             "url": "https://example.com/grill"},
+        ]
+        cfg = {"region": "Capital Region, NY", "api_config": {"google_places": {"nearby_lookup": True}}}
+
+        pairings = _build_pairings(events, restaurants, cfg)
+
+        assert [pairing["restaurant"] for pairing in pairings] == ["Nearby Pub", "Dinosaur Bar-B-Que"]
+
+    @patch('happenstance.aggregate._geocode_address')
+    @patch('happenstance.aggregate._fetch_nearby_restaurants')
+    def test_pairings_compute_each_geocoded_distance_once(self, mock_fetch_nearby, mock_geocode):
+        """Test that distances to geocoded restaurants are memoized per rounded pair."""
+        mock_fetch_nearby.return_value = []
+        mock_geocode.return_value = (43.0829, -73.7848)
+        aggregate._pair_distance.cache_clear()
+        events = [
+            {"title": f"SPAC Show {n}", "category": "music", "location": "SPAC, Saratoga Springs, NY",
+             "coordinates": {"lat": 43.05541 + n * 1e-6, "lng": -73.8059}}
+            for n in range(3)
+        ]
+        restaurants = [{"name": "Max London's", "cuisine": "American", "address": "466 Broadway, Saratoga Springs, NY"}]
+
+        pairings = _build_pairings(events, restaurants, {"region": "Capital Region, NY"})
+
+        assert [pairing["restaurant"] for pairing in pairings] == ["Max London's"] * 3
+        assert mock_geocode.call_count == 1
+        # Computed once for the first event, then reused by the two near-duplicate venues
+        assert aggregate._pair_distance.cache_info().misses == 1
+        assert aggregate._pair_distance.cache_info().hits == 2
+
     def test_distance_penalty_prefers_nearby_restaurant_over_distant_category_fit(self):
         """Test that a very distant restaurant does not win only on category fit."""
         event = {
@@ -368,6 +806,38 @@ class TestBuildPairings:
 
         assert nearby_score > distant_score
 
+    def test_variety_penalty_applies_to_repeated_scores(self):
+        """Test that memoized scores still reflect each call's use count."""
+        event = {"title": "Jazz Night", "category": "live music", "location": "The Egg, Albany, NY"}
+        restaurant = {"name": "Bistro", "cuisine": "Italian", "address": "1 State St, Albany, NY", "rating": 4.6}
+
+        fresh_score, fresh_reason = _compute_match_score(event, restaurant, distance_miles=0.3)
+        used_score, used_reason = _compute_match_score(event, restaurant, distance_miles=0.3, restaurant_use_count=2)
+
+        assert fresh_score - used_score == 6
+        assert fresh_reason == used_reason
+
+    def test_distance_points_match_full_score(self):
+        """Test that the cached distance-free score plus distance points equals the full score."""
+        event = {"title": "Jazz Night", "category": "live music", "location": "The Egg, Albany, NY"}
+        restaurant = {"name": "Bistro", "cuisine": "Italian", "address": "1 State St, Albany, NY", "rating": 4.6}
+        key = (*aggregate._event_features(event), *aggregate._restaurant_features(restaurant))
+
+        for distance in (None, 0.2, 1.0, 2.0, 5.0, 15.0, 20.0, 33.0, 90.0):
+            score, reason = _compute_match_score(event, restaurant, distance_miles=distance)
+            assert score == aggregate._base_score(key) + aggregate._distance_points(distance)
+        assert "90.0 mi away" in reason
+
+    def test_cuisine_keywords_match_whole_words(self):
+        """Test that multi-word cuisines match the event keyword tables by word."""
+        event = {"title": "Late Show", "category": "live music", "date": "2025-01-01T21:00:00"}
+
+        _, music_reason = _compute_match_score(event, {"name": "A", "cuisine": "New American"})
+        _, evening_reason = _compute_match_score(event, {"name": "B", "cuisine": "Pan-Asian"})
+
+        assert "New American pairs well with live music" in music_reason
+        assert "Pan-Asian open for evening dining" in evening_reason
+
 
 class TestNormalizeRestaurants:
     """Tests for restaurant normalization."""
@@ -0,0 +1,119 @@
+"""Tests for the real data generator script."""
+import hashlib
+import importlib.util
+import json
+import shlex
+import sys
+import types
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "scripts" / "generate_real_data.py"
+
+
+@pytest.fixture
+def generator():
+    """Load a fresh copy of the script module, so its lru caches start empty."""
+    spec = importlib.util.spec_from_file_location("_generate_real_data_test", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestEventsFrom:
+    """Tests for date-range filtering of events."""
+
+    def test_naive_start_is_treated_as_utc(self, generator):
+        """Test that a date without an offset compares as UTC instead of raising."""
+        first = generator.EVENTS_DATA[0]["date"]
+        naive_first = datetime.fromisoformat(first).replace(tzinfo=None)
+
+        assert generator.events_from("2000-01-01") == generator.EVENTS_DATA
+        assert generator.events_from(naive_first) == generator.events_from(first)
+        assert generator.events_from(naive_first.isoformat())[0]["date"] == first
+
+
+class TestExport:
+    """Tests for the --export mode."""
+
+    @pytest.mark.parametrize("argv", [["--export"], ["--export", "--pretty"]])
+    def test_export_evaluates_back_to_the_data(self, generator, capsysbinary, argv):
+        """Test that the printed statements set variables holding exactly the data."""
+        generator.main(argv)
+
+        words = shlex.split(capsysbinary.readouterr().out.decode())
+        exported = dict(word.split("=", 1) for word in words if word != "export")
+
+        assert json.loads(exported["AI_RESTAURANTS_DATA"]) == [dict(r) for r in generator.RESTAURANTS_DATA]
+        assert json.loads(exported["AI_EVENTS_DATA"]) == [dict(e) for e in generator.EVENTS_DATA]
+
+
+class TestPipedOutput:
+    """Tests for output when stdout is not a terminal."""
+
+    def test_piped_output_is_one_json_object(self, generator, capsysbinary):
+        """Test that piped output is bare compact JSON with both keys."""
+        generator.main([])
+
+        out = capsysbinary.readouterr().out
+        data = json.loads(out)
+
+        assert set(data) == {"restaurants", "events"}
+        assert data["restaurants"] == [dict(r) for r in generator.RESTAURANTS_DATA]
+        assert data["events"] == [dict(e) for e in generator.EVENTS_DATA]
+        assert out.count(b"\n") == 1
+
+    def test_report_flag_prints_report_when_piped(self, generator, capsysbinary):
+        """Test that --report keeps the human-readable report for piped output."""
+        generator.main(["--report"])
+
+        out = capsysbinary.readouterr().out
+
+        assert b"RESTAURANTS JSON DATA" in out
+        assert b"export AI_EVENTS_DATA=" in out
+
+
+class TestIndexes:
+    """Tests for the cuisine and category lookups."""
+
+    def test_restaurants_with_cuisine(self, generator):
+        """Test that a cuisine lookup returns exactly the matching rows in data order."""
+        expected = tuple(r for r in generator.RESTAURANTS_DATA if r["cuisine"] == "Italian")
+
+        assert generator.restaurants_with_cuisine("Italian") == expected
+        assert len(expected) > 1
+        assert generator.restaurants_with_cuisine("Martian") == ()
+
+    def test_events_in(self, generator):
+        """Test that a category lookup returns exactly the matching events, soonest first."""
+        expected = tuple(e for e in generator.EVENTS_DATA if e["category"] == "art")
+
+        assert generator.events_in("art") == expected
+        assert [e["date"] for e in expected] == sorted(e["date"] for e in expected)
+        assert generator.events_in("rodeo") == ()
+
+
+class TestPrecompiled:
+    """Tests for the JSON precomputed by scripts/build_data.py."""
+
+    def _install(self, monkeypatch, sha):
+        module = types.ModuleType("_data_strings")
+        module.SOURCE_SHA256 = sha
+        module.RESTAURANTS_JSON = b'["precompiled"]'
+        module.EVENTS_JSON = b'["precompiled"]'
+        monkeypatch.setitem(sys.modules, "_data_strings", module)
+
+    def test_matching_hash_uses_precompiled_bytes(self, generator, monkeypatch):
+        """Test that constants built from the current data file are served as-is."""
+        self._install(monkeypatch, hashlib.sha256(generator._DATA_FILE.read_bytes()).hexdigest())
+
+        assert generator.get_restaurants_json_bytes() == b'["precompiled"]'
+
+    def test_stale_hash_encodes_at_runtime(self, generator, monkeypatch):
+        """Test that constants built from an older data file are ignored."""
+        self._install(monkeypatch, "0" * 64)
+
+        assert json.loads(generator.get_restaurants_json_bytes()) == [dict(r) for r in generator.RESTAURANTS_DATA]
+        assert json.loads(generator.get_events_json_bytes()) == [dict(e) for e in generator.EVENTS_DATA]
@@ -9,6 +9,7 @@ from happenstance.sources import (
     _categorize_event,
     _infer_cuisine,
     _parse_json_from_text,
+    fetch_ai_restaurants,
     fetch_barpeople_events,
     fetch_eventbrite_events,
     fetch_google_places_restaurants,
@@ -412,3 +413,18 @@ class TestBarPeopleEvents:
         assert [event["category"] for event in events] == ["dj", "dj"]
         assert events[0]["date"].startswith("2026-06-26T21:00:00")
         assert events[1]["date"].startswith("2026-06-27T21:00:00")
+
+
+class TestRealDataFallback:
+    """Tests for the real data loaded when no AI response is available."""
+
+    def test_fetch_ai_restaurants_returns_mutable_dicts(self, monkeypatch):
+        """Test that records from the read-only script data come back as plain, editable dicts."""
+        monkeypatch.delenv("AI_RESTAURANTS_DATA", raising=False)
+
+        restaurants = fetch_ai_restaurants("Capital Region, NY", count=3)
+
+        assert len(restaurants) == 3
+        assert all(type(restaurant) is dict for restaurant in restaurants)
+        restaurants[0]["name"] = "Renamed"
+        assert fetch_ai_restaurants("Capital Region, NY", count=1)[0]["name"] != "Renamed"